@@ -1,12 +1,14 @@
 # Run-Tests.ps1
 # Script to run pytest tests with proper environment configuration
 #
-# USAGE: .\Run-Tests.ps1
+# USAGE: .\Run-Tests.ps1 [pytest arguments]
+#   e.g. .\Run-Tests.ps1 -n auto --dist loadgroup    # spread the tests over all cores with pytest-xdist,
+#                                                     # keeping each xdist_group on one worker
 #
 # WHAT THIS SCRIPT DOES:
 #   1. Activates the Python virtual environment (.venv)
 #   2. Sets PYTHONPATH to include 'src' and 'tests' directories
-#   3. Runs all pytest tests in .\tests with verbose output
+#   3. Runs all pytest tests in .\tests with verbose output, passing any extra arguments on to pytest
 #
 # OUTPUT:
 #   - Console: Full pytest output (all tests, pass/fail status, errors)
@@ -57,7 +59,7 @@ try {
     }
     # Run pytest with verbose output, capture all output
     # Use --tb=short for shorter tracebacks in the failures file
-    pytest .\tests -v 2>&1 | Tee-Object -Variable pytestOutput
+    pytest .\tests -v @args 2>&1 | Tee-Object -Variable pytestOutput
 
     # Filter and save only the failed tests to the file
     $FailedTests = $pytestOutput | Where-Object {
@@ -12,16 +12,15 @@ class TransactionTypeEnum(StrEnum):
 
     @staticmethod
     def from_value(value: str) -> "TransactionTypeEnum":
-        """Convert a string value to TransactionTypeEnum."""
-        value_lower = value.lower()
-        if value_lower == "revenue":
-            return TransactionTypeEnum.REVENUE
-        elif value_lower == "expenses":
-            return TransactionTypeEnum.EXPENSES
-        elif value_lower == "both":
-            return TransactionTypeEnum.BOTH
-        else:
-            raise ValueError(f"Invalid TransactionType value {value}")
+        """Convert a string value to TransactionTypeEnum, ignoring case."""
+        try:
+            return _TRANSACTION_TYPES_BY_LOWER_VALUE[value.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid TransactionType value {value}") from None
+
+
+# Case-folded lookup table for TransactionTypeEnum.from_value
+_TRANSACTION_TYPES_BY_LOWER_VALUE = {member.value.lower(): member for member in TransactionTypeEnum}
 
 
 class RecurrenceType(StrEnum):
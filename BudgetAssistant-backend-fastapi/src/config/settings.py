@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     RESET_TOKEN_EXPIRE_MINUTES: int = 60  # 1 hour
+    BCRYPT_ROUNDS: int = 12  # log2 of the bcrypt work factor used for new password hashes
 
     # CORS
     CORS_ORIGINS: list = [
@@ -1,9 +1,11 @@
 """RuleSetWrapper SQLModel database model."""
 
 import json
+from functools import lru_cache
 from logging import Logger
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 
+from pydantic_core import from_json, to_json
 from sqlmodel import Field, Relationship, SQLModel
 
 from common.logging_utils import LoggerFactory
@@ -12,10 +14,37 @@ from .associations import UserRuleSetLink
 
 if TYPE_CHECKING:
     from .category import Category
-    from .rules import RuleSet
+    from .rules import RuleSet, RuleSetCompiled
     from .user import User
 
 
+def _loads(rule_set_json: str) -> Any:
+    """Decode rule set JSON with pydantic-core's parser, raising json.JSONDecodeError for invalid input."""
+    try:
+        return from_json(rule_set_json)
+    except ValueError:
+        # Re-parse with the stdlib only to raise its JSONDecodeError, which callers expect
+        return json.loads(rule_set_json)
+
+
+@lru_cache(maxsize=1024)
+def _parse_rule_set_json(rule_set_json: str) -> Optional["RuleSet"]:
+    """Parse and validate a rule set JSON string, caching the result per distinct string."""
+    from .rules import RuleSet
+
+    rule_set_dict = _loads(rule_set_json)
+    if not rule_set_dict:
+        return None
+    return RuleSet.model_validate(rule_set_dict)
+
+
+@lru_cache(maxsize=1024)
+def _compile_rule_set_json(rule_set_json: str) -> Optional["RuleSetCompiled"]:
+    """Compile a rule set JSON string for evaluation, caching the result per distinct string."""
+    rule_set = _parse_rule_set_json(rule_set_json)
+    return rule_set.compile() if rule_set is not None else None
+
+
 class RuleSetWrapper(SQLModel, table=True):
     """Wrapper model for storing rule sets as JSON."""
 
@@ -44,19 +73,37 @@ class RuleSetWrapper(SQLModel, table=True):
     def get_rule_set(self) -> Optional["RuleSet"]:
         """Get the rule set as a strongly-typed RuleSet object.
 
+        Parsed rule sets are cached by their JSON text, so the returned object is shared
+        and must be treated as read-only.
+
         Returns:
             A RuleSet object if the JSON is valid and non-empty, None otherwise.
         """
-        from .rules import RuleSet
+        if not self.rule_set_json or self.rule_set_json == "{}":
+            return None
 
+        try:
+            return _parse_rule_set_json(self.rule_set_json)
+        except (json.JSONDecodeError, ValueError) as e:
+            self.logger.error(
+                f"Invalid JSON for rule set wrapper with id {self.id}: {self.rule_set_json}", exc_info=True
+            )
+            raise e
+
+    def get_compiled_rule_set(self) -> Optional["RuleSetCompiled"]:
+        """Get the rule set compiled for evaluation.
+
+        The compiled form evaluates exactly like get_rule_set().evaluate() but reads only plain
+        slot attributes. It is cached by JSON text as well.
+
+        Returns:
+            A RuleSetCompiled object if the JSON is valid and non-empty, None otherwise.
+        """
         if not self.rule_set_json or self.rule_set_json == "{}":
             return None
 
         try:
-            rule_set_dict = json.loads(self.rule_set_json)
-            if not rule_set_dict:
-                return None
-            return RuleSet.model_validate(rule_set_dict)
+            return _compile_rule_set_json(self.rule_set_json)
         except (json.JSONDecodeError, ValueError) as e:
             self.logger.error(
                 f"Invalid JSON for rule set wrapper with id {self.id}: {self.rule_set_json}", exc_info=True
@@ -69,7 +116,7 @@ class RuleSetWrapper(SQLModel, table=True):
         Args:
             rule_set: The RuleSet object to store.
         """
-        self.rule_set_json = json.dumps(rule_set.model_dump())
+        self.rule_set_json = rule_set.model_dump_json()
 
     def set_rule_set_from_dict(self, rule_set_dict: Dict[str, Any]) -> None:
         """Set the rule set from a dictionary (for API compatibility).
@@ -77,7 +124,7 @@ class RuleSetWrapper(SQLModel, table=True):
         Args:
             rule_set_dict: The rule set as a dictionary.
         """
-        self.rule_set_json = json.dumps(rule_set_dict)
+        self.rule_set_json = to_json(rule_set_dict).decode()
 
     def get_rule_set_as_dict(self) -> Dict[str, Any]:
         """Get the rule set as a dictionary (for API responses).
@@ -88,7 +135,7 @@ class RuleSetWrapper(SQLModel, table=True):
         if not self.rule_set_json:
             return {}
         try:
-            return json.loads(self.rule_set_json)
+            return _loads(self.rule_set_json)
         except json.JSONDecodeError as e:
             self.logger.error(
                 f"Invalid JSON for rule set wrapper with id {self.id}: {self.rule_set_json}", exc_info=True
@@ -6,8 +6,9 @@ for evaluating categorization rules.
 
 import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import TYPE_CHECKING, Any, ClassVar, List, Literal, Union
+from typing import TYPE_CHECKING, Any, ClassVar, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -311,6 +312,107 @@ class Rule(BaseModel, RuleIF):
         """Get the class type of the rule."""
         return self.clazz
 
+    def compile(self) -> "RuleCompiled":
+        """Compile the rule into a plain-attribute form for repeated evaluation."""
+        if self.field_type == "number":
+            operator = self.operator.name
+            numbers = tuple(float(v) for v in self.value)
+            patterns: Tuple[re.Pattern, ...] = ()
+            values_lc: Tuple[str, ...] = ()
+        else:
+            if self.operator in (CONTAINS_STRING_OP, MATCH_STRING_OP):
+                operator = "regex"
+            elif self.operator == FUZZY_MATCH_STRING_OP:
+                operator = "fuzzy"
+            else:
+                operator = "unsupported"
+            numbers = ()
+            patterns = (
+                tuple(re.compile(v.replace(" ", "\\s*"), re.IGNORECASE) for v in self.value)
+                if operator == "regex"
+                else ()
+            )
+            values_lc = tuple(v.lower() for v in self.value)
+        return RuleCompiled(
+            fields=tuple((first, second or None) for first, _, second in (f.partition(".") for f in self.field)),
+            is_number=self.field_type == "number",
+            operator=operator,
+            match_all=self.value_match_type == ALL_OF,
+            patterns=patterns,
+            values_lc=values_lc,
+            numbers=numbers,
+            description=str(self.operator),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RuleCompiled:
+    """Evaluation-only mirror of a Rule.
+
+    Operators are resolved to plain strings, regex values are pre-compiled and numeric values
+    pre-converted, so evaluating a transaction only touches slot attributes.
+    """
+
+    fields: Tuple[Tuple[str, Optional[str]], ...]
+    is_number: bool
+    operator: str
+    match_all: bool
+    patterns: Tuple[re.Pattern, ...]
+    values_lc: Tuple[str, ...]
+    numbers: Tuple[float, ...]
+    description: str
+
+    def _evaluate_string(self, actual_value: str) -> bool:
+        operator = self.operator
+        if operator == "regex":
+            if self.match_all:
+                return all(pattern.search(actual_value) for pattern in self.patterns)
+            return any(pattern.search(actual_value) for pattern in self.patterns)
+        if operator == "fuzzy":
+            actual_lc = actual_value.lower()
+            ratios = (SequenceMatcher(None, v, actual_lc).ratio() >= 0.8 for v in self.values_lc)
+            return all(ratios) if self.match_all else any(ratios)
+        raise ValueError(f"Unsupported operator {self.description}")
+
+    def _evaluate_number(self, actual_value: float) -> bool:
+        operator = self.operator
+        numbers = self.numbers
+        if operator in ("exact match", "equals"):
+            if self.match_all:
+                return all(actual_value == v for v in numbers)
+            return any(actual_value == v for v in numbers)
+        if operator == "not equals":
+            return all(actual_value != v for v in numbers)
+        if operator == "greater than":
+            return actual_value > numbers[0]
+        if operator == "greater than or equals":
+            return actual_value >= numbers[0]
+        if operator == "less than":
+            return actual_value < numbers[0]
+        if operator == "less than or equals":
+            return actual_value <= numbers[0]
+        raise ValueError(f"Unsupported number operator: {self.description}")
+
+    def evaluate(self, transaction: "Transaction") -> bool:
+        """Evaluate the rule against a transaction, with the same semantics as Rule.evaluate."""
+        for first, second in self.fields:
+            value = getattr(transaction, first, None)
+            if second is not None and value is not None:
+                value = getattr(value, second, None)
+            if value is None:
+                continue
+            if self.is_number:
+                if not isinstance(value, (int, float)):
+                    raise ValueError(f"Field value is not a number: {value}")
+                if self._evaluate_number(float(value)):
+                    return True
+            else:
+                if not isinstance(value, str):
+                    raise ValueError(f"Field value is not a string: {value}")
+                if self._evaluate_string(value):
+                    return True
+        return False
+
 
 class RuleSet(BaseModel, RuleIF):
     """Model for a set of rules with AND/OR conditions."""
@@ -374,11 +476,31 @@ class RuleSet(BaseModel, RuleIF):
         """Get the class type of the rule."""
         return self.clazz
 
+    def compile(self) -> "RuleSetCompiled":
+        """Compile the rule set and its nested rules for repeated evaluation."""
+        return RuleSetCompiled(is_and=self.condition == "AND", rules=tuple(rule.compile() for rule in self.rules))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, RuleSet):
             return False
         return self.condition == other.condition and self.rules == other.rules and self.is_child == other.is_child
 
 
+@dataclass(slots=True, frozen=True)
+class RuleSetCompiled:
+    """Evaluation-only mirror of a RuleSet."""
+
+    is_and: bool
+    rules: Tuple[Union[RuleCompiled, "RuleSetCompiled"], ...]
+
+    def evaluate(self, transaction: "Transaction") -> bool:
+        """Evaluate the rule set against a transaction, with the same semantics as RuleSet.evaluate."""
+        if not self.rules:
+            return False
+        if self.is_and:
+            return all(rule.evaluate(transaction) for rule in self.rules)
+        return any(rule.evaluate(transaction) for rule in self.rules)
+
+
 # Update forward references for recursive type
 RuleSet.model_rebuild()
@@ -176,11 +176,11 @@ class CategorizationService:
             The category_id if a match is found, None otherwise.
         """
         for rule_set_wrapper in rule_sets:
-            rule_set = rule_set_wrapper.get_rule_set()
+            rule_set = rule_set_wrapper.get_compiled_rule_set()
             if not rule_set:
                 continue
 
-            # Use the RuleSet's evaluate method directly
+            # Use the compiled RuleSet's evaluate method directly
             if rule_set.evaluate(transaction):
                 return rule_set_wrapper.category_id
 
@@ -235,9 +235,7 @@ class CategorizationService:
         with_category = 0
         without_category = 0
 
-        for transaction in transactions:
-            category = await self.categorize_transaction_with_traverser(transaction, traverser)
-
+        for transaction, category in zip(transactions, traverser.traverse_many(transactions)):
             if category is not None:
                 transaction.category_id = category.id
                 transaction.category = category
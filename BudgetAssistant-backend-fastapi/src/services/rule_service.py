@@ -1,17 +1,18 @@
 """Rule service with async SQLModel operations."""
 
-import asyncio
+import re
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-import networkx as nx
-from sqlalchemy import select
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from common.enums import TransactionTypeEnum
 from models import Category, RuleSetWrapper, User
 from models.associations import UserRuleSetLink
 from models.category import CategoryTree
+from models.rules import ANY_OF, CONTAINS_STRING_OP, MATCH_STRING_OP, Rule, RuleSet, RuleSetCompiled
 from models.transaction import Transaction
 
 
@@ -117,54 +118,56 @@ class RuleService:
     ) -> dict[TransactionTypeEnum, dict[str, RuleSetWrapper]]:
         """Get or create rule set wrappers for ALL categories, efficiently.
 
-        Fetches all categories and existing wrappers in two queries, bulk-creates
-        any missing wrappers and user-links, then returns the results grouped by
-        transaction type with qualified_name as key.
+        Fetches every category together with its wrapper and the user's link in a
+        single outer-joined query, bulk-creates any missing wrappers and user-links,
+        then returns the results grouped by transaction type with qualified_name as key.
         """
-        # 1. Fetch all categories and all existing wrappers in two queries
-        cat_result, wrapper_result, link_result = await asyncio.gather(
-            session.execute(select(Category)),
-            session.execute(select(RuleSetWrapper)),
-            session.execute(select(UserRuleSetLink).where(UserRuleSetLink.user_id == user.id)),
-        )
-        all_categories: list[Category] = list(cat_result.scalars().all())
-        all_wrappers: list[RuleSetWrapper] = list(wrapper_result.scalars().all())
-        existing_links: set[int] = {link.ruleset_id for link in link_result.scalars().all()}
-
-        # 2. Index existing wrappers by category_id
-        wrapper_by_cat_id: dict[int, RuleSetWrapper] = {w.category_id: w for w in all_wrappers}
-
-        # 3. Bulk-create missing wrappers
-        new_wrappers: list[RuleSetWrapper] = []
-        for cat in all_categories:
-            if cat.id not in wrapper_by_cat_id:
-                w = RuleSetWrapper(category_id=cat.id, rule_set_json="{}")
-                session.add(w)
-                new_wrappers.append(w)
-
-        if new_wrappers:
-            await session.flush()  # assigns IDs to new wrappers
-
-        # Merge new wrappers into the lookup
-        for w in new_wrappers:
-            wrapper_by_cat_id[w.category_id] = w
-
-        # 4. Bulk-create missing user-links
-        all_wrapper_ids = {w.id for w in wrapper_by_cat_id.values()}
-        missing_link_ids = all_wrapper_ids - existing_links
-        for wrapper_id in missing_link_ids:
-            session.add(UserRuleSetLink(user_id=user.id, ruleset_id=wrapper_id))
+        # 1. One query: category columns, the category's wrapper (if any) and whether the user is linked to it.
+        # Only the needed category columns are selected and relationship loading is disabled, so no
+        # selectin loads are triggered for the categories' transactions, children, etc.
+        rows = (
+            await session.execute(
+                select(Category.id, Category.qualified_name, Category.type, RuleSetWrapper, UserRuleSetLink.user_id)
+                .outerjoin(RuleSetWrapper, RuleSetWrapper.category_id == Category.id)
+                .outerjoin(
+                    UserRuleSetLink,
+                    and_(UserRuleSetLink.ruleset_id == RuleSetWrapper.id, UserRuleSetLink.user_id == user.id),
+                )
+                .options(lazyload("*"))
+            )
+        ).all()
+
+        # 2. Bulk-create missing wrappers with one INSERT ... RETURNING, which also assigns their IDs
+        missing_category_ids = [category_id for category_id, _, _, wrapper, _ in rows if wrapper is None]
+        new_wrappers: dict[int, RuleSetWrapper] = {}
+        if missing_category_ids:
+            created = await session.scalars(
+                insert(RuleSetWrapper).returning(RuleSetWrapper).options(lazyload("*")),
+                [{"category_id": category_id, "rule_set_json": "{}"} for category_id in missing_category_ids],
+            )
+            new_wrappers = {w.category_id: w for w in created.all()}
+
+        # 3. Build result grouped by transaction type, keyed by qualified_name,
+        # collecting the wrappers the user is not linked to yet
+        result: dict[TransactionTypeEnum, dict[str, RuleSetWrapper]] = defaultdict(dict)
+        missing_link_ids: list[int] = []
+        for category_id, qualified_name, category_type, wrapper, linked_user_id in rows:
+            if wrapper is None:
+                wrapper = new_wrappers[category_id]
+            if linked_user_id is None:
+                missing_link_ids.append(wrapper.id)
+            result[TransactionTypeEnum(category_type)][qualified_name] = wrapper
+
+        # 4. Bulk-create missing user-links with one multi-row INSERT
+        if missing_link_ids:
+            await session.execute(
+                insert(UserRuleSetLink),
+                [{"user_id": user.id, "ruleset_id": wrapper_id} for wrapper_id in missing_link_ids],
+            )
 
         if new_wrappers or missing_link_ids:
             await session.commit()
 
-        # 5. Build result grouped by transaction type, keyed by qualified_name
-        result: dict[TransactionTypeEnum, dict[str, RuleSetWrapper]] = defaultdict(dict)
-        for cat in all_categories:
-            wrapper = wrapper_by_cat_id.get(cat.id)
-            if wrapper:
-                result[cat.type][cat.qualified_name] = wrapper
-
         return result
 
     async def save_rule_set(
@@ -264,9 +267,8 @@ class RuleService:
 class RuleSetWrappersPostOrderTraverser:
     """Traverses category trees in post-order to find matching rule sets for transactions.
 
-    This class converts category trees to NetworkX directed graphs and performs
-    post-order traversal to find the most specific category that matches a transaction
-    based on its rule set.
+    This class flattens category trees into post-order category lists and walks them
+    to find the most specific category that matches a transaction based on its rule set.
     """
 
     def __init__(
@@ -282,44 +284,142 @@ class RuleSetWrappersPostOrderTraverser:
             revenue_category_tree: The category tree for revenue.
             rule_set_wrappers: List of rule set wrappers to use for matching.
         """
-        self.expenses_category_tree = self._category_tree_to_nx_digraph(expenses_category_tree)
-        self.revenue_category_tree = self._category_tree_to_nx_digraph(revenue_category_tree)
-        self.rules_by_category: Dict[Category, RuleSetWrapper] = {
-            wrapper.category: wrapper for wrapper in rule_set_wrappers if wrapper.category
+        # Flatten each tree into its post-order node list once; every traversal is then a plain list walk
+        self.expenses_nodes: List[Category] = self._category_tree_to_post_order(expenses_category_tree)
+        self.revenue_nodes: List[Category] = self._category_tree_to_post_order(revenue_category_tree)
+        # Resolve the nodes and root per transaction type once, so lookups don't branch
+        self._nodes_by_type: Dict[TransactionTypeEnum, List[Category]] = {
+            TransactionTypeEnum.EXPENSES: self.expenses_nodes,
+            TransactionTypeEnum.REVENUE: self.revenue_nodes,
+        }
+        # The root is always the last node visited in post-order
+        self._roots_by_type: Dict[TransactionTypeEnum, Optional[Category]] = {
+            transaction_type: nodes[-1] if nodes else None for transaction_type, nodes in self._nodes_by_type.items()
+        }
+        # Index wrappers by category id once, so each node visit is a single int-keyed lookup
+        self.rules_by_category_id: Dict[int, RuleSetWrapper] = {
+            wrapper.category_id: wrapper for wrapper in rule_set_wrappers if wrapper.category_id is not None
         }
         self.current_transaction: Optional[Transaction] = None
         self.current_category: Optional[Category] = None
         self.counter: Dict[Category, int] = defaultdict(int)
 
-    def _category_tree_to_nx_digraph(self, category_tree: CategoryTree) -> nx.DiGraph:
-        """Convert a CategoryTree to a NetworkX directed graph.
+        # Split rule sets into an "easy" bucket of plain-literal OR rules, decided through an inverted
+        # index (field -> literal -> category ids), and a "hard" bucket that needs full evaluation.
+        self.literal_index: Dict[str, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        self.easy_category_ids: Set[int] = set()
+        self.hard_rule_sets: Dict[int, RuleSetCompiled] = {}
+        for category_id, wrapper in self.rules_by_category_id.items():
+            rule_set = wrapper.get_rule_set()
+            if rule_set is None:
+                continue
+            if self._index_literal_rule_set(category_id, rule_set):
+                self.easy_category_ids.add(category_id)
+            else:
+                self.hard_rule_sets[category_id] = wrapper.get_compiled_rule_set()
+        self.matched_easy_category_ids: Set[int] = set()
+        self.lowercased_fields: Dict[str, str] = {}
+
+    @staticmethod
+    def _is_literal_rule(rule: Rule) -> bool:
+        """Check whether a rule is a case-insensitive substring search for plain ASCII literals.
+
+        Rule values are matched as regular expressions (with spaces widened to ``\\s*``), so only
+        values without regex metacharacters or whitespace behave like a plain substring test.
+        """
+        return (
+            rule.field_type == "string"
+            and rule.operator in (CONTAINS_STRING_OP, MATCH_STRING_OP)
+            and rule.value_match_type == ANY_OF
+            and all(value.isascii() and re.escape(value) == value for value in rule.value)
+        )
+
+    def _index_literal_rule_set(self, category_id: int, rule_set: RuleSet) -> bool:
+        """Add a rule set's literals to the inverted index if it consists only of literal rules.
 
         Args:
-            category_tree: The category tree to convert.
+            category_id: The category the rule set belongs to.
+            rule_set: The rule set to index.
 
         Returns:
-            A NetworkX DiGraph representing the category hierarchy.
+            True if the rule set was indexed, False if it needs full evaluation.
         """
-        graph = nx.DiGraph()
-
-        def add_category_to_graph(category: Category) -> None:
-            graph.add_node(category)
-            for child in category.children:
-                graph.add_edge(category, child)
-                add_category_to_graph(child)
+        if rule_set.condition != "OR" and len(rule_set.rules) > 1:
+            return False
+        if not all(isinstance(rule, Rule) and self._is_literal_rule(rule) for rule in rule_set.rules):
+            return False
+        for rule in rule_set.rules:
+            for field in rule.field:
+                for value in rule.value:
+                    self.literal_index[field][value.lower()].add(category_id)
+        return True
+
+    @staticmethod
+    def _get_field_value(transaction: Transaction, field_name: str) -> Any:
+        """Get a (possibly nested) field value from a transaction."""
+        first_part, _, second_part = field_name.partition(".")
+        value = getattr(transaction, first_part, None)
+        if second_part and value is not None:
+            value = getattr(value, second_part, None)
+        return value
+
+    def _lowercase_indexed_fields(self, transaction: Transaction) -> Dict[str, str]:
+        """Lowercase every transaction field referenced by the literal index, once per transaction."""
+        lowercased: Dict[str, str] = {}
+        for field in self.literal_index:
+            value = self._get_field_value(transaction, field)
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                raise ValueError(f"Field value is not a string: {value}")
+            lowercased[field] = value.lower()
+        return lowercased
+
+    def _match_literal_index(self) -> Set[int]:
+        """Get the ids of all easy-bucket categories whose literals occur in the current transaction."""
+        matched: Set[int] = set()
+        for field, value in self.lowercased_fields.items():
+            for literal, category_ids in self.literal_index[field].items():
+                if literal in value:
+                    matched |= category_ids
+        return matched
+
+    @staticmethod
+    def _category_tree_to_post_order(category_tree: CategoryTree) -> List[Category]:
+        """Flatten a CategoryTree into a list of its categories in post-order.
 
-        if category_tree.root:
-            add_category_to_graph(category_tree.root)
+        Args:
+            category_tree: The category tree to flatten.
 
-        return graph
+        Returns:
+            The categories with every child listed before its parent and the root last.
+        """
+        if category_tree.root is None:
+            return []
+
+        # Iterative DFS emitting a node once all of its children have been emitted
+        nodes: List[Category] = []
+        stack: List[tuple[Category, bool]] = [(category_tree.root, False)]
+        while stack:
+            category, children_done = stack.pop()
+            if children_done:
+                nodes.append(category)
+                continue
+            stack.append((category, True))
+            stack.extend((child, False) for child in reversed(category.children))
+        return nodes
 
     def set_current_transaction(self, transaction: Transaction) -> None:
         """Set the current transaction to evaluate.
 
         Args:
             transaction: The transaction to evaluate against rule sets.
+
+        Raises:
+            ValueError: If a field used by a literal rule holds a non-string value.
         """
         self.current_transaction = transaction
+        self.lowercased_fields = self._lowercase_indexed_fields(transaction)
 
     def traverse(self) -> Optional[Category]:
         """Traverse the category tree in post-order to find a matching category.
@@ -336,11 +436,11 @@ class RuleSetWrappersPostOrderTraverser:
         if self.current_transaction is None:
             raise ValueError("Transaction must be set before traversing!")
 
-        root = self.get_root_category()
-        if root is None:
+        categories_in_post_order = self.get_category_nodes()
+        if not categories_in_post_order:
             return None
 
-        categories_in_post_order = list(nx.dfs_postorder_nodes(self.get_category_tree(), root))
+        self.matched_easy_category_ids = self._match_literal_index()
 
         for category in categories_in_post_order:
             self.current_category = category
@@ -353,6 +453,28 @@ class RuleSetWrappersPostOrderTraverser:
 
         return None
 
+    def traverse_many(self, transactions: List[Transaction]) -> List[Optional[Category]]:
+        """Categorize a batch of transactions, e.g. for an import.
+
+        The literal index and post-order node lists are built once in ``__init__``, so each
+        transaction only costs one field-lowercasing pass plus one walk over its node list.
+
+        Args:
+            transactions: The transactions to categorize.
+
+        Returns:
+            The matching Category (or None) for each transaction, in input order.
+        """
+        # Bind the per-transaction steps to locals to keep attribute lookups out of the loop
+        set_current_transaction = self.set_current_transaction
+        traverse = self.traverse
+        categories: List[Optional[Category]] = []
+        append = categories.append
+        for transaction in transactions:
+            set_current_transaction(transaction)
+            append(traverse())
+        return categories
+
     def get_root_category(self) -> Optional[Category]:
         """Get the root category based on the current transaction type.
 
@@ -361,32 +483,17 @@ class RuleSetWrappersPostOrderTraverser:
         """
         if self.current_transaction is None:
             return None
+        return self._roots_by_type[self.current_transaction.get_transaction_type()]
 
-        transaction_type = self.current_transaction.get_transaction_type()
-
-        if transaction_type == TransactionTypeEnum.EXPENSES:
-            # Find root node (node with in-degree 0)
-            roots = [n for n, d in self.expenses_category_tree.in_degree() if d == 0]
-            return roots[0] if roots else None
-        else:
-            roots = [n for n, d in self.revenue_category_tree.in_degree() if d == 0]
-            return roots[0] if roots else None
-
-    def get_category_tree(self) -> nx.DiGraph:
-        """Get the appropriate category tree based on transaction type.
+    def get_category_nodes(self) -> List[Category]:
+        """Get the post-order category list based on transaction type.
 
         Returns:
-            The NetworkX DiGraph for expenses or revenue.
+            The expenses or revenue categories, children before parents.
         """
         if self.current_transaction is None:
-            return self.expenses_category_tree
-
-        transaction_type = self.current_transaction.get_transaction_type()
-
-        if transaction_type == TransactionTypeEnum.EXPENSES:
-            return self.expenses_category_tree
-        else:
-            return self.revenue_category_tree
+            return self.expenses_nodes
+        return self._nodes_by_type[self.current_transaction.get_transaction_type()]
 
     def rule_set_matches(self, category: Category) -> bool:
         """Check if a category's rule set matches the current transaction.
@@ -397,12 +504,10 @@ class RuleSetWrappersPostOrderTraverser:
         Returns:
             True if the category has a rule set that matches the transaction.
         """
-        rule_set_wrapper = self.rules_by_category.get(category)
-        if rule_set_wrapper is None:
-            return False
+        if category.id in self.easy_category_ids:
+            return category.id in self.matched_easy_category_ids
 
-        # Get the rule set as a RuleSet object
-        rule_set = rule_set_wrapper.get_rule_set()
+        rule_set = self.hard_rule_sets.get(category.id)
         if rule_set is None:
             return False
 
@@ -115,6 +115,31 @@ class TransactionService:
             return column.desc()
         return column
 
+    async def _get_user_account_numbers(self, user: User, session: AsyncSession) -> List[str]:
+        """Get the account numbers of the bank accounts the user can access."""
+        account_result = await session.execute(
+            select(UserBankAccountLink.bank_account_number).where(UserBankAccountLink.user_id == user.id)
+        )
+        return list(account_result.scalars().all())
+
+    async def _count_matching(self, filter_condition, session: AsyncSession) -> int:
+        """Count the transactions matching a filter."""
+        count_query = select(func.count()).select_from(Transaction).where(filter_condition)
+        total_result = await session.execute(count_query)
+        return total_result.scalar() or 0
+
+    async def count_transactions(
+        self,
+        query: Optional[TransactionQuery],
+        user: User,
+        session: AsyncSession,
+    ) -> int:
+        """Count the transactions matching the query, without loading any of them."""
+        user_accounts = await self._get_user_account_numbers(user, session)
+        if not user_accounts:
+            return 0
+        return await self._count_matching(self._build_query_filter(query, user_accounts), session)
+
     async def page_transactions(
         self,
         query: Optional[TransactionQuery],
@@ -127,10 +152,7 @@ class TransactionService:
     ) -> tuple[list[Transaction], int]:
         """Get paginated transactions with filtering."""
         # Get user's accessible account numbers
-        account_result = await session.execute(
-            select(UserBankAccountLink.bank_account_number).where(UserBankAccountLink.user_id == user.id)
-        )
-        user_accounts = list(account_result.scalars().all())
+        user_accounts = await self._get_user_account_numbers(user, session)
 
         if not user_accounts:
             return [], 0
@@ -139,13 +161,15 @@ class TransactionService:
         filter_condition = self._build_query_filter(query, user_accounts)
 
         # Count total
-        count_query = select(func.count()).select_from(Transaction).where(filter_condition)
-        total_result = await session.execute(count_query)
-        total_elements = total_result.scalar() or 0
+        total_elements = await self._count_matching(filter_condition, session)
+
+        # Nothing to load when no rows match or the page starts past the last row
+        offset = page * size
+        if offset >= total_elements:
+            return [], total_elements
 
         # Get sorted and paginated results
         sort_column = self._get_sort_column(sort_property, sort_order)
-        offset = page * size
 
         stmt = select(Transaction).where(filter_condition).order_by(sort_column).offset(offset).limit(size)
         result = await session.execute(stmt)
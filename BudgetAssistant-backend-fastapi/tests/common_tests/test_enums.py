@@ -1,5 +1,7 @@
 """Tests for enums module."""
 
+from enum import StrEnum
+
 import pytest
 
 from common.enums import RecurrenceType, TransactionTypeEnum
@@ -46,6 +48,7 @@ class TestTransactionTypeEnum:
 
     def test_enum_is_str_enum(self):
         """Test that enum values can be used as strings."""
+        assert issubclass(TransactionTypeEnum, StrEnum)
         assert str(TransactionTypeEnum.REVENUE) == "REVENUE"
         assert f"Type: {TransactionTypeEnum.EXPENSES}" == "Type: EXPENSES"
 
@@ -61,6 +64,7 @@ class TestRecurrenceType:
 
     def test_enum_is_str_enum(self):
         """Test that enum values can be used as strings."""
+        assert issubclass(RecurrenceType, StrEnum)
         assert str(RecurrenceType.RECURRENT) == "RECURRENT"
         assert (
             f"Recurrence: {RecurrenceType.NON_RECURRENT}" == "Recurrence: NON_RECURRENT"
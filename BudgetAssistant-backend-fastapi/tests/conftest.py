@@ -1,16 +1,21 @@
 """Pytest configuration and fixtures for async database testing."""
 
 import asyncio
-from typing import AsyncGenerator
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 # Import all models to ensure they're registered with SQLModel metadata
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
+from auth.security import pwd_context
 from db.database import engine as production_engine
 from db.database import get_session
 from main import app
@@ -27,85 +32,169 @@ from models import (  # noqa: F401
 from models.password_reset_token import PasswordResetToken  # noqa: F401
 from models.token_blocklist import TokenBlocklist  # noqa: F401
 
-# Use in-memory SQLite for tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Use in-memory SQLite for tests unless another database is configured. Under pytest-xdist every worker
+# process gets its own in-memory database; for a shared server, put "{worker_id}" in the URL
+# (e.g. ".../budget_test_{worker_id}") to give each worker its own database.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:").replace(
+    "{worker_id}", os.environ.get("PYTEST_XDIST_WORKER", "master")
+)
 
+# Hash test passwords with bcrypt's minimum work factor; verification reads the rounds from the hash itself
+pwd_context.update(bcrypt__rounds=4)
 
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_production_engine():
-    """Cleanup production engine after all tests complete"""
-    yield
-    # Dispose the production engine to prevent hanging
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session event loop on uvloop, as uvicorn does, where uvicorn[standard] installs it (not on Windows)."""
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.create_task(production_engine.dispose())
-        else:
-            loop.run_until_complete(production_engine.dispose())
-    except RuntimeError:
-        # If no event loop, create one for cleanup
-        asyncio.run(production_engine.dispose())
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_engine():
-    """Create an async engine for testing."""
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        echo=False,
-        connect_args={"check_same_thread": False},
-    )
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def cleanup_production_engine():
+    """Dispose the production engine after all tests complete, on the session event loop."""
+    yield
+    # Dispose the production engine to prevent hanging
+    await production_engine.dispose()
+
 
+@pytest_asyncio.fixture(scope="session")
+async def async_engine():
+    """Create the async engine and schema once for the whole test session."""
+    if TEST_DATABASE_URL.startswith("sqlite"):
+        # StaticPool hands out one shared DBAPI connection, so an in-memory database lives for the whole session
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside the per-test outer transaction,
+        # instead of pysqlite's implicit transaction handling releasing them as top-level commits.
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        # Test data is always rolled back, so skip fsyncs and keep the journal in memory when
+        # TEST_DATABASE_URL points at an on-disk SQLite file (both are already the case for ":memory:")
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_sqlite_durability(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.close()
+    else:
+        # A small pool primed once for the session; connections are trusted, so no pre-ping round-trip per checkout.
+        # Tests hold at most a couple of connections at a time, so no overflow: a leaked connection shows up as a
+        # pool timeout instead of quietly opening more server connections per xdist worker.
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            echo=False,
+            pool_size=5,
+            max_overflow=0,
+            pool_pre_ping=False,
+        )
+
+    # A fresh in-memory database is always empty, so skip create_all's per-table existence checks there
     async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(SQLModel.metadata.create_all, checkfirst=":memory:" not in TEST_DATABASE_URL)
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-
     await engine.dispose()
 
 
+@asynccontextmanager
+async def _outer_transaction(async_engine) -> AsyncIterator[AsyncConnection]:
+    """Yield a connection wrapped in an outer transaction that is rolled back on exit."""
+    async with async_engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
 @pytest_asyncio.fixture(scope="function")
-async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create an async session for testing."""
-    async_session_maker = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
+async def async_connection(async_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Yield a connection wrapped in an outer transaction that is rolled back after each test."""
+    async with _outer_transaction(async_engine) as conn:
+        yield conn
 
-    async with async_session_maker() as session:
-        yield session
-        await session.rollback()
 
+def shared_connection_fixtures(scope: str) -> tuple[Any, Any, Any]:
+    """Build fixtures that share one outer transaction per ``scope`` ("module" or "class").
 
-# Test user credentials
-TEST_USER_PASSWORD = "TestPassword123"  # Must have uppercase for password validation
-TEST_USER_EMAIL = "testuser@example.com"
+    A test module opts in by assigning the result at module level::
 
+        shared_connection, async_connection, shared_session_maker = shared_connection_fixtures("module")
 
-@pytest_asyncio.fixture(scope="function")
-async def client(async_engine) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for testing without authentication.
+    ``scope``-scoped data fixtures insert through ``shared_session_maker``, so the data is built once, while
+    ``async_connection`` runs each test in a SAVEPOINT on the same connection that is rolled back afterwards.
+    Mark such modules with ``pytest.mark.xdist_group``, so ``-n ... --dist loadgroup`` keeps them on one worker.
+    """
 
-    This fixture overrides the get_session dependency to use the test database
-    so that the FastAPI app uses the same database as the test session.
+    @pytest_asyncio.fixture(scope=scope)
+    async def shared_connection(async_engine) -> AsyncGenerator[AsyncConnection, None]:
+        """Yield a connection whose outer transaction spans the whole scope."""
+        async with _outer_transaction(async_engine) as conn:
+            yield conn
+
+    @pytest_asyncio.fixture
+    async def async_connection(shared_connection: AsyncConnection) -> AsyncGenerator[AsyncConnection, None]:
+        """Run each test in a SAVEPOINT on the shared connection, so the shared data survives."""
+        savepoint = await shared_connection.begin_nested()
+        try:
+            yield shared_connection
+        finally:
+            await savepoint.rollback()
+
+    @pytest.fixture(scope=scope)
+    def shared_session_maker(shared_connection: AsyncConnection) -> async_sessionmaker:
+        """Session maker for inserting the shared data."""
+        return async_sessionmaker(
+            bind=shared_connection, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+
+    return shared_connection, async_connection, shared_session_maker
+
+
+@pytest.fixture(scope="function")
+def test_session_maker(async_connection) -> async_sessionmaker:
+    """Create a session maker bound to the per-test connection.
+
+    Sessions join the outer transaction through a SAVEPOINT, so ``commit()`` only releases
+    the SAVEPOINT and everything is discarded when the outer transaction is rolled back.
     """
-    # Create a session maker for the test database
-    test_session_maker = async_sessionmaker(
-        async_engine,
+    return async_sessionmaker(
+        bind=async_connection,
         class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
         autocommit=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    # Override the get_session dependency to use the test database
+
+@pytest_asyncio.fixture(scope="function")
+async def async_session(test_session_maker) -> AsyncGenerator[AsyncSession, None]:
+    """Create an async session for testing."""
+    async with test_session_maker() as session:
+        yield session
+        await session.rollback()
+
+
+def _override_get_session(test_session_maker: async_sessionmaker) -> None:
+    """Override the get_session dependency so the app uses the per-test connection."""
+
     async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
         async with test_session_maker() as session:
             try:
@@ -119,6 +208,33 @@ async def client(async_engine) -> AsyncGenerator[AsyncClient, None]:
 
     app.dependency_overrides[get_session] = get_test_session
 
+
+# Test user credentials
+TEST_USER_PASSWORD = "TestPassword123"  # Must have uppercase for password validation
+TEST_USER_EMAIL = "testuser@example.com"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def anon_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one unauthenticated async HTTP client, shared by the whole test session.
+
+    Meant for requests that never reach the database, such as 401/404/405/422 checks, so it
+    does not override the get_session dependency and can be reused across tests.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(test_session_maker) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async HTTP client for testing without authentication.
+
+    This fixture overrides the get_session dependency to use the test database
+    so that the FastAPI app uses the same database as the test session.
+    """
+    _override_get_session(test_session_maker)
+
     try:
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -130,35 +246,14 @@ async def client(async_engine) -> AsyncGenerator[AsyncClient, None]:
 
 @pytest_asyncio.fixture(scope="function")
 async def authenticated_client(
-    async_engine,
+    test_session_maker,
 ) -> AsyncGenerator[tuple[AsyncClient, str], None]:
     """Create an async HTTP client with authentication.
 
     This fixture registers a new user, logs in, and returns the client
     with the access token. Returns a tuple of (client, access_token).
     """
-    # Create a session maker for the test database
-    test_session_maker = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
-
-    # Override the get_session dependency to use the test database
-    async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
-        async with test_session_maker() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
-
-    app.dependency_overrides[get_session] = get_test_session
+    _override_get_session(test_session_maker)
 
     try:
         transport = ASGITransport(app=app)
@@ -207,7 +302,7 @@ async def auth_headers(authenticated_client) -> dict[str, str]:
 
 @pytest_asyncio.fixture(scope="function")
 async def authenticated_client_with_session(
-    async_engine,
+    test_session_maker,
 ) -> AsyncGenerator[tuple[AsyncClient, str, async_sessionmaker], None]:
     """Create an async HTTP client with authentication and access to the test session maker.
 
@@ -215,28 +310,7 @@ async def authenticated_client_with_session(
     with the access token and session maker for direct database access.
     Returns a tuple of (client, access_token, test_session_maker).
     """
-    # Create a session maker for the test database
-    test_session_maker = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
-
-    # Override the get_session dependency to use the test database
-    async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
-        async with test_session_maker() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
-
-    app.dependency_overrides[get_session] = get_test_session
+    _override_get_session(test_session_maker)
 
     try:
         transport = ASGITransport(app=app)
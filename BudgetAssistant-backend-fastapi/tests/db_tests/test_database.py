@@ -1,6 +1,8 @@
 """Tests for database configuration."""
 
 import pytest
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel
 
 from models import User
@@ -9,36 +11,39 @@ from models import User
 class TestDatabaseConfiguration:
     """Test cases for database configuration."""
 
-    @pytest.mark.asyncio
-    async def test_create_db_and_tables(self, async_engine):
-        """Test that database tables can be created."""
-        # Tables are already created in the fixture
-        # This test verifies the engine is working
-        async with async_engine.begin() as conn:
-            # Check that we can execute queries
-            result = await conn.run_sync(
-                lambda sync_conn: sync_conn.execute(
-                    SQLModel.metadata.tables["user"].select()
-                )
-            )
-            # Should return empty result, but no error
-            assert result is not None
+    def test_create_db_and_tables(self):
+        """Test that the user table is registered with the metadata that create_all builds the schema from."""
+        # The schema itself is created once per session by the async_engine fixture, which every
+        # database test depends on, so checking the metadata needs no round-trip
+        assert {"id", "email", "password_hash"} <= set(SQLModel.metadata.tables["user"].columns.keys())
 
-    @pytest.mark.asyncio
     async def test_session_can_be_used(self, async_session):
         """Test that async session can be used for queries."""
-        from sqlalchemy import text
-
         result = await async_session.execute(text("SELECT 1"))
         row = result.scalar()
         assert row == 1
 
-    @pytest.mark.asyncio
-    async def test_session_rollback_on_error(self, async_session):
-        """Test that session rolls back on error."""
+    async def test_session_does_not_expire_on_commit(self, async_session):
+        """Test that committed objects stay loaded, so reading them afterwards issues no SELECT."""
+        user = User(
+            email="loaded@example.com",
+            password_hash="password",
+        )
+        async_session.add(user)
+        await async_session.commit()
 
-        from sqlalchemy.exc import IntegrityError
+        assert inspect(user).expired_attributes == set()
 
+    async def test_session_commit_stays_inside_outer_transaction(self, async_session, async_connection):
+        """Test that a commit only releases the session's SAVEPOINT, leaving the per-test rollback in charge."""
+        async_session.add(User(email="savepoint@example.com", password_hash="password"))
+        await async_session.commit()
+
+        assert async_connection.in_transaction()
+        assert not async_connection.in_nested_transaction()
+
+    async def test_session_rollback_on_error(self, async_session):
+        """Test that session rolls back on error."""
         # Add a user
         user = User(
             email="test@example.com",
@@ -47,15 +52,17 @@ class TestDatabaseConfiguration:
         async_session.add(user)
         await async_session.commit()
 
-        # Try to add duplicate email - should fail
-        user2 = User(
-            email="test@example.com",  # Duplicate email
-            password_hash="password2",
-        )
-        async_session.add(user2)
-
+        # Try to add duplicate email inside a SAVEPOINT - should fail
         with pytest.raises(IntegrityError):
-            await async_session.commit()
+            async with async_session.begin_nested():
+                async_session.add(
+                    User(
+                        email="test@example.com",  # Duplicate email
+                        password_hash="password2",
+                    )
+                )
+                await async_session.flush()
 
-        # Session should be rolled back
-        await async_session.rollback()
+        # Only the SAVEPOINT is rolled back; the first user is still there
+        result = await async_session.execute(select(User).where(User.email == "test@example.com"))
+        assert result.scalar_one().password_hash == "password"
@@ -1,17 +1,33 @@
 """Tests for BankAccount model."""
 
+from typing import Awaitable, Callable
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import BankAccount, User
+from models.associations import UserBankAccountLink
 from tests.utils import assert_persisted
 
 
+@pytest.fixture
+def make_bank_account(async_session: AsyncSession) -> Callable[..., Awaitable[BankAccount]]:
+    """Add and flush a bank account, for tests that only need the row to exist."""
+
+    async def make(account_number: str = "123456", alias: str | None = "Savings") -> BankAccount:
+        bank_account = BankAccount(account_number=account_number, alias=alias)
+        async_session.add(bank_account)
+        await async_session.flush()
+        return bank_account
+
+    return make
+
+
 class TestBankAccount:
     """Test cases for the BankAccount model."""
 
-    @pytest.mark.asyncio
     async def test_create_bank_account_with_valid_data(self, async_session):
         """Test creating a bank account with valid data."""
         bank_account = BankAccount(account_number="123456", alias="Savings")
@@ -30,27 +46,19 @@ class TestBankAccount:
             {"account_number": "123456", "alias": "Savings"},
         )
 
-    @pytest.mark.asyncio
-    async def test_create_bank_account_with_duplicate_account_number(
-        self, async_session
-    ):
+    async def test_create_bank_account_with_duplicate_account_number(self, async_session, make_bank_account):
         """Test that creating a bank account with duplicate account number raises error."""
-        bank_account1 = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account1)
-        await async_session.commit()
-
-        bank_account2 = BankAccount(account_number="123456", alias="Checking")
-        async_session.add(bank_account2)
+        await make_bank_account()
 
+        # Flush the duplicate inside a SAVEPOINT, so the failure only rolls that back
         with pytest.raises(IntegrityError):
-            await async_session.commit()
+            async with async_session.begin_nested():
+                async_session.add(BankAccount(account_number="123456", alias="Checking"))
+                await async_session.flush()
 
-    @pytest.mark.asyncio
-    async def test_to_json_includes_all_fields(self, async_session):
+    async def test_to_json_includes_all_fields(self, async_session, make_bank_account):
         """Test that to_json includes all fields."""
-        bank_account = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account)
-        await async_session.commit()
+        bank_account = await make_bank_account()
 
         bank_account_json = bank_account.to_json()
 
@@ -69,63 +77,37 @@ class TestBankAccount:
         assert persisted_json["account_number"] == "123456"
         assert persisted_json["alias"] == "Savings"
 
-    def test_normalize_account_number_removes_spaces_and_lowercases(self):
-        """Test that normalize_account_number removes spaces and converts to lowercase."""
-        normalized = BankAccount.normalize_account_number(" 123 456 ")
-        assert normalized == "123456"
-
-    @pytest.mark.asyncio
-    async def test_str_method_returns_account_number(self, async_session):
-        """Test that __str__ returns the account number."""
-        bank_account = BankAccount(account_number="123456", alias="Savings")
-        assert str(bank_account) == "123456"
-
-    @pytest.mark.asyncio
-    async def test_add_multiple_users_to_bank_account(self, async_session):
+    async def test_add_multiple_users_to_bank_account(self, async_session, make_bank_account):
         """Test adding multiple users to a bank account."""
-        bank_account = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account)
-        await async_session.commit()
-
-        user1 = User(
-            first_name="Test1",
-            last_name="User1",
-            email="user1@example.com",
-            password_hash="password1",
-        )
-        user2 = User(
-            first_name="Test2",
-            last_name="User2",
-            email="user2@example.com",
-            password_hash="password2",
-        )
-        user3 = User(
-            first_name="Test3",
-            last_name="User3",
-            email="user3@example.com",
-            password_hash="password3",
+        bank_account = await make_bank_account()
+
+        # One multi-row INSERT for the users and one for their links to the bank account
+        user_ids = (
+            await async_session.scalars(
+                insert(User).returning(User.id),
+                [
+                    {
+                        "first_name": f"Test{i}",
+                        "last_name": f"User{i}",
+                        "email": f"user{i}@example.com",
+                        "password_hash": f"password{i}",
+                    }
+                    for i in (1, 2, 3)
+                ],
+            )
+        ).all()
+        await async_session.execute(
+            insert(UserBankAccountLink),
+            [
+                {"user_id": user_id, "bank_account_number": bank_account.account_number}
+                for user_id in user_ids
+            ],
         )
-
-        user1.bank_accounts.append(bank_account)
-        user2.bank_accounts.append(bank_account)
-        user3.bank_accounts.append(bank_account)
-
-        async_session.add_all([user1, user2, user3])
         await async_session.commit()
 
-        # Query the users associated with the bank account using link table
-        from sqlalchemy import select
-
-        from models.associations import UserBankAccountLink
-
-        result = await async_session.execute(
-            select(User)
-            .join(UserBankAccountLink)
-            .where(
-                UserBankAccountLink.bank_account_number == bank_account.account_number
-            )
-        )
-        users = result.scalars().all()
+        # Reload the bank account; its users relationship is selectin-loaded with a single IN query
+        bank_account = await async_session.get(BankAccount, "123456", populate_existing=True)
+        users = bank_account.users
 
         assert len(users) == 3
         emails = [u.email for u in users]
@@ -133,7 +115,6 @@ class TestBankAccount:
         assert "user2@example.com" in emails
         assert "user3@example.com" in emails
 
-    @pytest.mark.asyncio
     async def test_bank_account_with_null_alias(self, async_session):
         """Test creating a bank account with null alias."""
         bank_account = BankAccount(account_number="789012")
@@ -151,18 +132,26 @@ class TestBankAccount:
             {"account_number": "789012", "alias": None},
         )
 
-    @pytest.mark.asyncio
-    async def test_retrieve_bank_account_by_account_number(self, async_session):
+    async def test_retrieve_bank_account_by_account_number(self, async_session, make_bank_account):
         """Test retrieving a bank account by account number."""
-        bank_account = BankAccount(account_number="654321", alias="Checking")
-        async_session.add(bank_account)
-        await async_session.commit()
+        await make_bank_account("654321", "Checking")
 
-        result = await async_session.execute(
-            select(BankAccount).where(BankAccount.account_number == "654321")
-        )
-        retrieved = result.scalar_one_or_none()
+        retrieved = await async_session.get(BankAccount, "654321")
 
         assert retrieved is not None
         assert retrieved.account_number == "654321"
         assert retrieved.alias == "Checking"
+
+
+class TestBankAccountUnit:
+    """Test cases for BankAccount behaviour that needs no database."""
+
+    def test_normalize_account_number_removes_spaces_and_lowercases(self):
+        """Test that normalize_account_number removes spaces and converts to lowercase."""
+        normalized = BankAccount.normalize_account_number(" 123 456 ")
+        assert normalized == "123456"
+
+    def test_str_method_returns_account_number(self):
+        """Test that __str__ returns the account number."""
+        bank_account = BankAccount(account_number="123456", alias="Savings")
+        assert str(bank_account) == "123456"
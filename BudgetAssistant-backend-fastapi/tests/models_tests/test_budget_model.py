@@ -1,37 +1,69 @@
 """Tests for BudgetTree and BudgetTreeNode models."""
 
 import pytest
+import pytest_asyncio
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from common.enums import TransactionTypeEnum
 from models import BankAccount, BudgetTree, BudgetTreeNode, Category
+from tests.conftest import shared_connection_fixtures
 from tests.utils import assert_persisted
 
+pytestmark = pytest.mark.xdist_group("budget_model")
+shared_connection, async_connection, shared_session_maker = shared_connection_fixtures("module")
+
+
+# Display names of the shared expense categories, keyed by qualified name. "root" matches the constant
+# checked by BudgetTreeNode.
+CATEGORY_NAMES = {
+    "root": "root",
+    "parent": "Parent Category",
+    "child": "Child Category",
+    "child1": "Child Category 1",
+    "child2": "Child Category 2",
+    "test": "Test Category",
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def categories(shared_session_maker: async_sessionmaker) -> dict[str, Category]:
+    """Create the expense categories the budget tree nodes point at, keyed by qualified name."""
+    rows = [
+        Category(name=name, type=TransactionTypeEnum.EXPENSES, qualified_name=qualified_name)
+        for qualified_name, name in CATEGORY_NAMES.items()
+    ]
+    async with shared_session_maker() as session:
+        session.add_all(rows)
+        await session.commit()
+    return {category.qualified_name: category for category in rows}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def bank_account(shared_session_maker: async_sessionmaker) -> BankAccount:
+    """Create the bank account that the budget trees belong to."""
+    bank_account = BankAccount(account_number="123456", alias="Savings")
+    async with shared_session_maker() as session:
+        session.add(bank_account)
+        await session.commit()
+    return bank_account
+
 
 class TestBudgetTreeNode:
     """Test cases for the BudgetTreeNode model."""
 
-    @pytest.mark.asyncio
-    async def test_create_budget_tree_node_with_valid_data(self, async_session):
+    async def test_create_budget_tree_node_with_valid_data(self, async_session, categories):
         """Test creating a budget tree node with valid data."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
+        category = categories["test"]
 
         budget_tree_node = BudgetTreeNode(
             category_id=category.id,
             amount=100,
         )
         async_session.add(budget_tree_node)
-        await async_session.commit()
-        await async_session.refresh(budget_tree_node)
+        await async_session.flush()
 
         assert budget_tree_node.id is not None
         assert budget_tree_node.category_id == category.id
@@ -49,37 +81,20 @@ class TestBudgetTreeNode:
             },
         )
 
-    @pytest.mark.asyncio
-    async def test_add_child_to_budget_tree_node(self, async_session):
+    async def test_add_child_to_budget_tree_node(self, async_session, categories):
         """Test adding a child node to a budget tree node."""
-        parent_category = Category(
-            name="Parent Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="parent",
-        )
-        child_category = Category(
-            name="Child Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="child",
-        )
-        async_session.add_all([parent_category, child_category])
-        await async_session.commit()
-        await async_session.refresh(parent_category)
-        await async_session.refresh(child_category)
-
-        parent_node = BudgetTreeNode(category_id=parent_category.id, amount=200)
+        parent_node = BudgetTreeNode(category_id=categories["parent"].id, amount=200)
         async_session.add(parent_node)
-        await async_session.commit()
-        await async_session.refresh(parent_node)
+        await async_session.flush()
         parent_node_id = parent_node.id
 
         child_node = BudgetTreeNode(
-            category_id=child_category.id,
+            category_id=categories["child"].id,
             amount=50,
             parent_id=parent_node.id,
         )
         async_session.add(child_node)
-        await async_session.commit()
+        await async_session.flush()
         child_node_id = child_node.id
 
         # Query children explicitly
@@ -98,63 +113,42 @@ class TestBudgetTreeNode:
             "id",
             child_node_id,
             {
-                "category_id": child_category.id,
+                "category_id": categories["child"].id,
                 "amount": 50,
                 "parent_id": parent_node_id,
             },
         )
 
         # Verify parent's children relationship using selectinload
-        result = await async_session.execute(
-            select(BudgetTreeNode)
-            .where(BudgetTreeNode.id == parent_node_id)
-            .options(selectinload(BudgetTreeNode.children))
-            .execution_options(populate_existing=True)
+        persisted_parent = await async_session.get(
+            BudgetTreeNode,
+            parent_node_id,
+            options=[selectinload(BudgetTreeNode.children)],
+            populate_existing=True,
         )
-        persisted_parent = result.scalar_one_or_none()
 
         assert persisted_parent is not None
         assert len(persisted_parent.children) == 1
         assert persisted_parent.children[0].id == child_node_id
 
-    @pytest.mark.asyncio
-    async def test_get_children_returns_correct_children(self, async_session):
+    async def test_get_children_returns_correct_children(self, async_session, categories):
         """Test that getting children returns all child nodes."""
-        parent_category = Category(
-            name="Parent Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="parent",
-        )
-        child_category1 = Category(
-            name="Child Category 1",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="child1",
-        )
-        child_category2 = Category(
-            name="Child Category 2",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="child2",
-        )
-        async_session.add_all([parent_category, child_category1, child_category2])
-        await async_session.commit()
-
-        parent_node = BudgetTreeNode(category_id=parent_category.id, amount=200)
+        parent_node = BudgetTreeNode(category_id=categories["parent"].id, amount=200)
         async_session.add(parent_node)
-        await async_session.commit()
-        await async_session.refresh(parent_node)
+        await async_session.flush()
 
         child_node1 = BudgetTreeNode(
-            category_id=child_category1.id,
+            category_id=categories["child1"].id,
             amount=50,
             parent_id=parent_node.id,
         )
         child_node2 = BudgetTreeNode(
-            category_id=child_category2.id,
+            category_id=categories["child2"].id,
             amount=75,
             parent_id=parent_node.id,
         )
         async_session.add_all([child_node1, child_node2])
-        await async_session.commit()
+        await async_session.flush()
 
         # Query children explicitly
         result = await async_session.execute(
@@ -167,93 +161,45 @@ class TestBudgetTreeNode:
         assert 50 in amounts
         assert 75 in amounts
 
-    @pytest.mark.asyncio
-    async def test_is_root_category_returns_true_for_root_node(self, async_session):
+    async def test_is_root_category_returns_true_for_root_node(self, categories):
         """Test is_root_category returns True for root category node."""
-        root_category = Category(
-            name="root",  # Use literal "root" to match the constant
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="root",
-        )
-        async_session.add(root_category)
-        await async_session.commit()
-        await async_session.refresh(root_category)
-
-        root_node = BudgetTreeNode(category_id=root_category.id, amount=300)
-        root_node.category = root_category
+        root_node = BudgetTreeNode(category_id=categories["root"].id, amount=300)
+        root_node.category = categories["root"]
 
         assert root_node.is_root_category() is True
 
-    @pytest.mark.asyncio
-    async def test_is_root_category_returns_false_for_non_root_node(
-        self, async_session
-    ):
+    async def test_is_root_category_returns_false_for_non_root_node(self, categories):
         """Test is_root_category returns False for non-root category node."""
-        child_category = Category(
-            name="Child Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="child",
-        )
-        async_session.add(child_category)
-        await async_session.commit()
-        await async_session.refresh(child_category)
-
-        child_node = BudgetTreeNode(category_id=child_category.id, amount=100)
-        child_node.category = child_category
+        child_node = BudgetTreeNode(category_id=categories["child"].id, amount=100)
+        child_node.category = categories["child"]
 
         assert child_node.is_root_category() is False
 
-    @pytest.mark.asyncio
-    async def test_parent_node_is_root_returns_true_for_direct_child(
-        self, async_session
-    ):
+    async def test_parent_node_is_root_returns_true_for_direct_child(self, async_session, categories):
         """Test parent_node_is_root returns True for direct child of root."""
-        root_category = Category(
-            name="root",  # Use literal "root" to match the constant
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="root",
-        )
-        child_category = Category(
-            name="Child Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="child",
-        )
-        async_session.add_all([root_category, child_category])
-        await async_session.commit()
-        await async_session.refresh(root_category)
-        await async_session.refresh(child_category)
-
-        root_node = BudgetTreeNode(category_id=root_category.id, amount=300)
-        root_node.category = root_category
+        root_node = BudgetTreeNode(category_id=categories["root"].id, amount=300)
         async_session.add(root_node)
-        await async_session.commit()
-        await async_session.refresh(root_node)
+        await async_session.flush()
 
+        # Wire up the relationships outside the session, so the module-scoped categories are not cascaded into
+        # it and expired by the per-test rollback
+        async_session.expunge(root_node)
+        root_node.category = categories["root"]
         child_node = BudgetTreeNode(
-            category_id=child_category.id,
+            category_id=categories["child"].id,
             amount=100,
             parent_id=root_node.id,
         )
-        child_node.category = child_category
+        child_node.category = categories["child"]
         child_node.parent = root_node
 
         assert child_node.parent_node_is_root() is True
 
-    @pytest.mark.asyncio
-    async def test_budget_tree_node_equality(self, async_session):
+    def test_budget_tree_node_equality(self):
         """Test budget tree node equality."""
-        category = Category(
-            name="Test",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
-        node1 = BudgetTreeNode(id=1, category_id=category.id, amount=100)
-        node2 = BudgetTreeNode(id=1, category_id=category.id, amount=100)
-        node3 = BudgetTreeNode(id=2, category_id=category.id, amount=100)
+        node1 = BudgetTreeNode(id=1, category_id=1, amount=100)
+        node2 = BudgetTreeNode(id=1, category_id=1, amount=100)
+        node3 = BudgetTreeNode(id=2, category_id=1, amount=100)
 
         assert node1 == node2
         assert node1 != node3
@@ -262,34 +208,18 @@ class TestBudgetTreeNode:
 class TestBudgetTree:
     """Test cases for the BudgetTree model."""
 
-    @pytest.mark.asyncio
-    async def test_create_budget_tree_with_valid_data(self, async_session):
+    async def test_create_budget_tree_with_valid_data(self, async_session, categories, bank_account):
         """Test creating a budget tree with valid data."""
-        bank_account = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account)
-        await async_session.commit()
-
-        root_category = Category(
-            name="Root",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="root",
-        )
-        async_session.add(root_category)
-        await async_session.commit()
-        await async_session.refresh(root_category)
-
-        root_node = BudgetTreeNode(category_id=root_category.id, amount=100)
+        root_node = BudgetTreeNode(category_id=categories["root"].id, amount=100)
         async_session.add(root_node)
-        await async_session.commit()
-        await async_session.refresh(root_node)
+        await async_session.flush()
 
         budget_tree = BudgetTree(
             bank_account_id=bank_account.account_number,
             root_id=root_node.id,
         )
         async_session.add(budget_tree)
-        await async_session.commit()
-        await async_session.refresh(budget_tree)
+        await async_session.flush()
 
         assert budget_tree.bank_account_id == bank_account.account_number
         assert budget_tree.root_id == root_node.id
@@ -306,46 +236,36 @@ class TestBudgetTree:
             },
         )
 
-    @pytest.mark.asyncio
-    async def test_create_budget_tree_with_duplicate_bank_account(self, async_session):
+    async def test_create_budget_tree_with_duplicate_bank_account(self, async_session, categories, bank_account):
         """Test that duplicate bank accounts for budget tree raise an error."""
-        bank_account = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account)
-        await async_session.commit()
-
-        root_category = Category(
-            name="Root",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="root",
-        )
-        async_session.add(root_category)
-        await async_session.commit()
-
-        root_node1 = BudgetTreeNode(category_id=root_category.id, amount=100)
-        root_node2 = BudgetTreeNode(category_id=root_category.id, amount=200)
+        root_node1 = BudgetTreeNode(category_id=categories["root"].id, amount=100)
+        root_node2 = BudgetTreeNode(category_id=categories["root"].id, amount=200)
         async_session.add_all([root_node1, root_node2])
-        await async_session.commit()
-        await async_session.refresh(root_node1)
-        await async_session.refresh(root_node2)
+        await async_session.flush()
 
         budget_tree1 = BudgetTree(
             bank_account_id=bank_account.account_number,
             root_id=root_node1.id,
         )
         async_session.add(budget_tree1)
-        await async_session.commit()
-
-        budget_tree2 = BudgetTree(
-            bank_account_id=bank_account.account_number,
-            root_id=root_node2.id,
-        )
-        async_session.add(budget_tree2)
+        await async_session.flush()
 
+        # Flush the duplicate inside a SAVEPOINT, so the failure only rolls that back
         with pytest.raises(IntegrityError):
-            await async_session.commit()
+            async with async_session.begin_nested():
+                async_session.add(
+                    BudgetTree(
+                        bank_account_id=bank_account.account_number,
+                        root_id=root_node2.id,
+                    )
+                )
+                await async_session.flush()
+
+
+class TestBudgetTreeUnit:
+    """Test cases for BudgetTree behaviour that needs no database."""
 
-    @pytest.mark.asyncio
-    async def test_budget_tree_str_method(self, async_session):
+    def test_budget_tree_str_method(self):
         """Test budget tree __str__ method."""
         budget_tree = BudgetTree(bank_account_id="123456")
 
@@ -1,9 +1,11 @@
 """Tests for Counterparty model."""
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from models import Counterparty, User
+from models.associations import UserCounterpartyLink
 from tests.utils import assert_persisted
 
 
@@ -90,10 +92,6 @@ class TestCounterparty:
         await async_session.commit()
 
         # Query the users associated with the counterparty
-        from sqlalchemy import select
-
-        from models.associations import UserCounterpartyLink
-
         result = await async_session.execute(
             select(User)
             .join(UserCounterpartyLink)
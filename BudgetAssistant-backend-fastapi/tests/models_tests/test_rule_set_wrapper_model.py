@@ -1,29 +1,40 @@
 """Tests for RuleSetWrapper model."""
 
 import pytest
+import pytest_asyncio
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from common.enums import TransactionTypeEnum
 from models import Category, RuleSetWrapper, User
+from tests.conftest import shared_connection_fixtures
 from tests.utils import assert_persisted
 
+pytestmark = pytest.mark.xdist_group("rule_set_wrapper_model")
+shared_connection, async_connection, shared_session_maker = shared_connection_fixtures("module")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def category(shared_session_maker: async_sessionmaker) -> Category:
+    """Create the category the rule set wrappers belong to."""
+    category = Category(
+        name="Test Category",
+        type=TransactionTypeEnum.EXPENSES,
+        qualified_name="test",
+    )
+    async with shared_session_maker() as session:
+        session.add(category)
+        await session.commit()
+    return category
+
 
 class TestRuleSetWrapper:
     """Test cases for the RuleSetWrapper model."""
 
     @pytest.mark.asyncio
-    async def test_create_rule_set_wrapper_with_valid_data(self, async_session):
+    async def test_create_rule_set_wrapper_with_valid_data(self, async_session, category):
         """Test creating a rule set wrapper with valid data."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         rule_set_dict = {
             "condition": "AND",
             "rules": [
@@ -52,8 +63,7 @@ class TestRuleSetWrapper:
         rule_set_wrapper.set_rule_set_from_dict(rule_set_dict)
 
         async_session.add(rule_set_wrapper)
-        await async_session.commit()
-        await async_session.refresh(rule_set_wrapper)
+        await async_session.flush()
 
         assert rule_set_wrapper.id is not None
         assert rule_set_wrapper.category_id == category.id
@@ -75,17 +85,8 @@ class TestRuleSetWrapper:
         assert persisted_dict["clazz"] == "RuleSet"
 
     @pytest.mark.asyncio
-    async def test_get_rule_set_as_dict(self, async_session):
+    async def test_get_rule_set_as_dict(self, async_session, category):
         """Test getting rule set as dictionary."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         rule_set_dict = {
             "condition": "OR",
             "rules": [],
@@ -108,19 +109,10 @@ class TestRuleSetWrapper:
         assert retrieved_dict["clazz"] == "RuleSet"
 
     @pytest.mark.asyncio
-    async def test_get_rule_set_returns_typed_object(self, async_session):
+    async def test_get_rule_set_returns_typed_object(self, async_session, category):
         """Test getting rule set as strongly-typed RuleSet object."""
         from models.rules import RuleSet
 
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         rule_set_dict = {
             "condition": "OR",
             "rules": [],
@@ -144,33 +136,22 @@ class TestRuleSetWrapper:
         assert rule_set.is_child is True
 
     @pytest.mark.asyncio
-    async def test_add_users_to_rule_set_wrapper(self, async_session):
+    async def test_add_users_to_rule_set_wrapper(self, async_session, category):
         """Test adding users to a rule set wrapper."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         user = User(
             email="test@example.com",
             password_hash="password",
         )
-        async_session.add(user)
-        await async_session.commit()
-        user_id = user.id
-
         rule_set_wrapper = RuleSetWrapper(
             category_id=category.id,
             rule_set_json="{}",
         )
         rule_set_wrapper.users.append(user)
+
+        # The user is cascaded in with the wrapper, so both are written in one flush
         async_session.add(rule_set_wrapper)
-        await async_session.commit()
-        await async_session.refresh(rule_set_wrapper)
+        await async_session.flush()
+        user_id = user.id
         wrapper_id = rule_set_wrapper.id
 
         assert len(rule_set_wrapper.users) == 1
@@ -192,17 +173,8 @@ class TestRuleSetWrapper:
         assert persisted_wrapper.users[0].email == "test@example.com"
 
     @pytest.mark.asyncio
-    async def test_update_rule_set(self, async_session):
+    async def test_update_rule_set(self, async_session, category):
         """Test updating rule set in wrapper."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         initial_rule_set = {
             "condition": "AND",
             "rules": [],
@@ -214,7 +186,7 @@ class TestRuleSetWrapper:
         rule_set_wrapper.set_rule_set_from_dict(initial_rule_set)
 
         async_session.add(rule_set_wrapper)
-        await async_session.commit()
+        await async_session.flush()
 
         new_rule_set = {
             "condition": "OR",
@@ -224,24 +196,15 @@ class TestRuleSetWrapper:
             "type": "EXPENSES",
         }
         rule_set_wrapper.set_rule_set_from_dict(new_rule_set)
-        await async_session.commit()
+        await async_session.flush()
         await async_session.refresh(rule_set_wrapper)
 
         retrieved_dict = rule_set_wrapper.get_rule_set_as_dict()
         assert retrieved_dict["condition"] == "OR"
 
     @pytest.mark.asyncio
-    async def test_empty_rule_set(self, async_session):
+    async def test_empty_rule_set(self, async_session, category):
         """Test handling of empty rule set."""
-        category = Category(
-            name="Test Category",
-            type=TransactionTypeEnum.EXPENSES,
-            qualified_name="test",
-        )
-        async_session.add(category)
-        await async_session.commit()
-        await async_session.refresh(category)
-
         rule_set_wrapper = RuleSetWrapper(
             category_id=category.id,
             rule_set_json="{}",
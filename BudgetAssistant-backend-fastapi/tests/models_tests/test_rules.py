@@ -25,9 +25,11 @@ from models.rules import (
     MATCH_STRING_OP,
     NOT_EQUALS_NUMBER_OP,
     Rule,
+    RuleCompiled,
     RuleMatchType,
     RuleOperator,
     RuleSet,
+    RuleSetCompiled,
     TransactionField,
 )
 from tests.utils import (
@@ -856,3 +858,93 @@ class TestFuzzyMatch:
         txn = MockTransaction()
         txn.communications = "Carrefour"
         assert rule.evaluate(txn) is True
+
+
+# =============================================================================
+# Compiled rule tests
+# =============================================================================
+
+
+class TestCompiledRules(CreateTestCasesStringMixin):
+    """Tests that compiled rules evaluate exactly like their Pydantic counterparts."""
+
+    @pytest.mark.parametrize("operator,value_match_type", [(CONTAINS_STRING_OP, ANY_OF), (CONTAINS_STRING_OP, ALL_OF)])
+    def test_compiled_string_rule_matches_rule(self, operator, value_match_type):
+        for item in self.create_test_cases_string(operator, value_match_type):
+            rule, transaction = RuleAndTransactionPreparer(item["transaction"], item["rule"]).run()
+            compiled = rule.compile()
+            assert isinstance(compiled, RuleCompiled)
+            assert compiled.evaluate(transaction) is rule.evaluate(transaction) is True
+            transaction.communications = transaction.transaction = transaction.counterparty.name = "zzz"
+            assert compiled.evaluate(transaction) is rule.evaluate(transaction)
+
+    @pytest.mark.parametrize(
+        "operator,value,value_match_type,amount",
+        [
+            (EQUALS_NUMBER_OP, [10, 20], ANY_OF, 20),
+            (MATCH_NUMBER_OP, [10, 20], ALL_OF, 20),
+            (NOT_EQUALS_NUMBER_OP, [0.0], ANY_OF, 0.0),
+            (GT_NUMBER_OP, [50.0], ANY_OF, 75.0),
+            (LTE_NUMBER_OP, [200.0], ANY_OF, 201.0),
+        ],
+    )
+    def test_compiled_number_rule_matches_rule(self, operator, value, value_match_type, amount):
+        rule = Rule(
+            field=["amount"],
+            field_type="number",
+            value=value,
+            value_match_type=value_match_type,
+            operator=operator,
+            clazz="Rule",
+            type=TransactionTypeEnum.EXPENSES,
+        )
+        txn = MockTransaction()
+        txn.amount = amount
+        assert rule.compile().evaluate(txn) is rule.evaluate(txn)
+
+    def test_compiled_fuzzy_rule_matches_rule(self):
+        rule = Rule(
+            field=["communications"],
+            field_type="string",
+            value=["Carefour", "Carrefour"],
+            value_match_type=ALL_OF,
+            operator=FUZZY_MATCH_STRING_OP,
+            clazz="Rule",
+            type=TransactionTypeEnum.EXPENSES,
+        )
+        txn = MockTransaction()
+        for communications in ("Carrefour", "completely different string xyz"):
+            txn.communications = communications
+            assert rule.compile().evaluate(txn) is rule.evaluate(txn)
+
+    def test_compiled_rule_rejects_non_string_value(self):
+        rule = StringRuleFactory.build(field=["communications"])
+        txn = MockTransaction()
+        txn.communications = 42
+        with pytest.raises(ValueError, match="not a string"):
+            rule.compile().evaluate(txn)
+
+    @staticmethod
+    def _outcome(rule: Union[Rule, RuleSet, RuleCompiled, RuleSetCompiled], txn: MockTransaction):
+        """Evaluate and return the result, or the error message for unsupported operators."""
+        try:
+            return rule.evaluate(txn)
+        except ValueError as e:
+            return str(e)
+
+    def test_compiled_rule_set_matches_rule_set(self):
+        rule_set = create_random_rule_set_deep()
+        compiled = rule_set.compile()
+        assert isinstance(compiled, RuleSetCompiled)
+
+        txn = MockTransaction()
+        txn.communications = " ".join(rule_set.rules[0].rules[0].rules[0].rules[0].value)
+        assert self._outcome(compiled, txn) == self._outcome(rule_set, txn)
+
+    def test_wrapper_caches_compiled_rule_set(self):
+        rule_set = create_random_rule_set()
+        wrapper = RuleSetWrapper(id=1, rule_set_json=rule_set.model_dump_json())
+        other = RuleSetWrapper(id=2, rule_set_json=wrapper.rule_set_json)
+
+        assert wrapper.get_compiled_rule_set() is other.get_compiled_rule_set()
+        assert RuleSetWrapper(id=3, rule_set_json="{}").get_compiled_rule_set() is None
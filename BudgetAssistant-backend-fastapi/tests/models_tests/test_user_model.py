@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from models import BankAccount, User
+from models.associations import UserBankAccountLink
 from tests.utils import assert_persisted
 
 
@@ -22,8 +23,7 @@ class TestUser:
             password_hash="hashedpassword123",
         )
         async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
+        await async_session.flush()
 
         assert user.id is not None
         assert user.first_name == "Test"
@@ -55,18 +55,20 @@ class TestUser:
             password_hash="password123",
         )
         async_session.add(user1)
-        await async_session.commit()
-
-        user2 = User(
-            first_name="Second",
-            last_name="User",
-            email="duplicate@example.com",
-            password_hash="password456",
-        )
-        async_session.add(user2)
+        await async_session.flush()
 
+        # Flush the duplicate inside a SAVEPOINT, so the failure only rolls that back
         with pytest.raises(IntegrityError):
-            await async_session.commit()
+            async with async_session.begin_nested():
+                async_session.add(
+                    User(
+                        first_name="Second",
+                        last_name="User",
+                        email="duplicate@example.com",
+                        password_hash="password456",
+                    )
+                )
+                await async_session.flush()
 
     @pytest.mark.asyncio
     async def test_retrieve_user_by_email(self, async_session):
@@ -79,7 +81,7 @@ class TestUser:
             password_hash="securepassword123",
         )
         async_session.add(user)
-        await async_session.commit()
+        await async_session.flush()
 
         result = await async_session.execute(select(User).where(User.email == email))
         retrieved_user = result.scalar_one_or_none()
@@ -88,8 +90,7 @@ class TestUser:
         assert retrieved_user.email == email
         assert retrieved_user.id == user.id
 
-    @pytest.mark.asyncio
-    async def test_user_str_method(self, async_session):
+    def test_user_str_method(self):
         """Test the __str__ method returns the email."""
         user = User(
             first_name="Test",
@@ -107,7 +108,7 @@ class TestUser:
             password_hash="password",
         )
         async_session.add(user)
-        await async_session.commit()
+        await async_session.flush()
 
         assert user.is_active is True
         assert user.is_superuser is False
@@ -132,9 +133,6 @@ class TestUser:
     async def test_associate_bank_account_with_user(self, async_session):
         """Test associating a bank account with a user."""
         bank_account = BankAccount(account_number="123456", alias="Savings")
-        async_session.add(bank_account)
-        await async_session.commit()
-
         user = User(
             first_name="Test",
             last_name="User",
@@ -142,9 +140,8 @@ class TestUser:
             password_hash="securepassword123",
         )
         user.bank_accounts.append(bank_account)
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
+        async_session.add_all([bank_account, user])
+        await async_session.flush()
         user_id = user.id
 
         assert len(user.bank_accounts) == 1
@@ -183,11 +180,11 @@ class TestUser:
             password_hash="securepassword123",
         )
         async_session.add(user)
-        await async_session.commit()
+        await async_session.flush()
 
         new_password_hash = "newsecurepassword456"
         user.password_hash = new_password_hash
-        await async_session.commit()
+        await async_session.flush()
         await async_session.refresh(user)
 
         assert user.password_hash == new_password_hash
@@ -195,12 +192,7 @@ class TestUser:
     @pytest.mark.asyncio
     async def test_remove_bank_account_from_user(self, async_session):
         """Test removing a bank account from a user doesn't affect other users."""
-        from models.associations import UserBankAccountLink
-
         bank_account = BankAccount(account_number="123456789", alias="Savings Account")
-        async_session.add(bank_account)
-        await async_session.commit()
-
         user1 = User(
             first_name="Test",
             last_name="User",
@@ -208,18 +200,14 @@ class TestUser:
             password_hash="securepassword123",
         )
         user1.bank_accounts.append(bank_account)
-        async_session.add(user1)
-
         user2 = User(
             first_name="Other",
             last_name="User",
             email="other@example.com",
             password_hash="anotherpassword123",
         )
-        async_session.add(user2)
-        await async_session.commit()
-        await async_session.refresh(user1)
-        await async_session.refresh(user2)
+        async_session.add_all([bank_account, user1, user2])
+        await async_session.flush()
 
         # Check user1 has the bank account
         result1 = await async_session.execute(
@@ -248,7 +236,7 @@ class TestUser:
         )
         link_to_delete = link.scalar_one()
         await async_session.delete(link_to_delete)
-        await async_session.commit()
+        await async_session.flush()
 
         # Check user1 no longer has the bank account
         result3 = await async_session.execute(
@@ -263,9 +251,6 @@ class TestUser:
     async def test_related_name_bank_accounts_to_users(self, async_session):
         """Test the back_populates relationship from BankAccount to Users."""
         bank_account = BankAccount(account_number="12345")
-        async_session.add(bank_account)
-        await async_session.commit()
-
         user = User(
             first_name="Test",
             last_name="User",
@@ -274,8 +259,8 @@ class TestUser:
         )
         user.bank_accounts.append(bank_account)
         async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(bank_account)
+        await async_session.flush()
+        await async_session.refresh(bank_account, ["users"])
 
         assert len(bank_account.users) == 1
         assert bank_account.users[0].email == "test@example.com"
@@ -4,165 +4,110 @@ from datetime import date
 from unittest.mock import patch
 
 import pytest
-from httpx import ASGITransport, AsyncClient
 
 from main import app
+from tests.utils import asgi_status
 
+# A well-formed period query body, so requests fail on authentication rather than validation
+PERIOD_QUERY = {
+    "account_number": "BE12345",
+    "transaction_type": "EXPENSES",
+    "start": "2023-01-01",
+    "end": "2023-12-31",
+    "grouping": "MONTH",
+}
 
+
+@pytest.mark.xdist_group("anon_http")
 class TestAnalysisEndpoints:
     """Integration tests for analysis endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_revenue_expenses_per_period_without_auth(self):
-        """Test getting revenue/expenses per period without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            pytest.param(
+                "POST",
                 "/api/analysis/revenue-expenses-per-period",
-                json={
-                    "account_number": "BE12345",
-                    "transaction_type": "EXPENSES",
-                    "start": "2023-01-01",
-                    "end": "2023-12-31",
-                    "grouping": "MONTH",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_revenue_expenses_per_period_and_category_without_auth(self):
-        """Test getting revenue/expenses per period and category without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
+                {"json_body": PERIOD_QUERY},
+                id="revenue_expenses_per_period",
+            ),
+            pytest.param(
+                "POST",
                 "/api/analysis/revenue-expenses-per-period-and-category",
-                json={
-                    "account_number": "BE12345",
-                    "transaction_type": "EXPENSES",
-                    "start": "2023-01-01",
-                    "end": "2023-12-31",
-                    "grouping": "MONTH",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_category_details_for_period_without_auth(self):
-        """Test getting category details without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
+                {"json_body": PERIOD_QUERY},
+                id="revenue_expenses_per_period_and_category",
+            ),
+            pytest.param(
+                "POST",
                 "/api/analysis/category-details-for-period",
-                json={
-                    "account_number": "BE12345",
-                    "transaction_type": "EXPENSES",
-                    "start": "2023-01-01",
-                    "end": "2023-12-31",
-                    "grouping": "MONTH",
-                    "category_qualified_name": "expenses/groceries",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_categories_for_account_without_auth(self):
-        """Test getting categories for account without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
+                {"json_body": {**PERIOD_QUERY, "category_qualified_name": "expenses/groceries"}},
+                id="category_details_for_period",
+            ),
+            pytest.param(
+                "GET",
                 "/api/analysis/categories-for-account",
-                params={
-                    "bank_account": "BE12345",
-                    "transaction_type": "EXPENSES",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_track_budget_without_auth(self):
-        """Test tracking budget without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/analysis/track-budget",
-                json={
-                    "account_number": "BE12345",
-                    "transaction_type": "EXPENSES",
-                    "start": "2023-01-01",
-                    "end": "2023-12-31",
-                    "grouping": "MONTH",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_resolve_date_shortcut_without_auth(self):
-        """Test resolving date shortcut without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
+                {"params": {"bank_account": "BE12345", "transaction_type": "EXPENSES"}},
+                id="categories_for_account",
+            ),
+            pytest.param("POST", "/api/analysis/track-budget", {"json_body": PERIOD_QUERY}, id="track_budget"),
+            pytest.param(
+                "GET",
                 "/api/analysis/resolve-date-shortcut",
-                params={"shortcut": "current month"},
-            )
-
-            assert response.status_code == 401
+                {"params": {"shortcut": "current month"}},
+                id="resolve_date_shortcut",
+            ),
+        ],
+    )
+    async def test_endpoint_requires_auth(self, method, path, kwargs):
+        """Test that analysis endpoints reject requests without authentication."""
+        assert await asgi_status(app, method, path, **kwargs) == 401
 
     @pytest.mark.asyncio
-    async def test_resolve_date_shortcut_invalid_shortcut(self):
+    async def test_resolve_date_shortcut_invalid_shortcut(self, anon_client):
         """Test resolving invalid date shortcut."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/analysis/resolve-date-shortcut",
-                params={"shortcut": "invalid shortcut"},
-            )
+        response = await anon_client.get(
+            "/api/analysis/resolve-date-shortcut",
+            params={"shortcut": "invalid shortcut"},
+        )
 
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
+        # Should fail validation (422) or auth (401)
+        assert response.status_code in [401, 422]
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestAnalysisQueryValidation:
     """Tests for analysis query validation."""
 
     @pytest.mark.asyncio
-    async def test_revenue_expenses_query_missing_required_fields(self):
+    async def test_revenue_expenses_query_missing_required_fields(self, anon_client):
         """Test that missing required fields are rejected."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/analysis/revenue-expenses-per-period",
-                json={
-                    # Missing required fields
-                    "grouping": "MONTH",
-                },
-            )
+        response = await anon_client.post(
+            "/api/analysis/revenue-expenses-per-period",
+            json={
+                # Missing required fields
+                "grouping": "MONTH",
+            },
+        )
 
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
+        # Should fail validation (422) or auth (401)
+        assert response.status_code in [401, 422]
 
     @pytest.mark.asyncio
-    async def test_revenue_expenses_query_invalid_grouping(self):
+    async def test_revenue_expenses_query_invalid_grouping(self, anon_client):
         """Test that invalid grouping is rejected."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/analysis/revenue-expenses-per-period",
-                json={
-                    "account_number": "BE12345",
-                    "transaction_type": "EXPENSES",
-                    "start": "2023-01-01",
-                    "end": "2023-12-31",
-                    "grouping": "INVALID",  # Invalid grouping
-                },
-            )
+        response = await anon_client.post(
+            "/api/analysis/revenue-expenses-per-period",
+            json={
+                "account_number": "BE12345",
+                "transaction_type": "EXPENSES",
+                "start": "2023-01-01",
+                "end": "2023-12-31",
+                "grouping": "INVALID",  # Invalid grouping
+            },
+        )
 
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
+        # Should fail validation (422) or auth (401)
+        assert response.status_code in [401, 422]
 
 
 class TestAnalysisEndpointsAuthenticated:
@@ -1,129 +1,148 @@
 """Tests for authentication router."""
 
+import bcrypt
 import pytest
-from httpx import ASGITransport, AsyncClient
+from jose import jwt
 
-from auth.security import create_access_token, get_password_hash, verify_password
+from auth.security import create_access_token, get_password_hash, pwd_context, verify_password
 from config.settings import settings
 from main import app
+from tests.utils import asgi_status
+
+SAMPLE_PASSWORD = "securepassword123"
+
+
+def bcrypt_rounds(hashed: str) -> int:
+    """Read the work factor from a modular-crypt bcrypt hash such as "$2b$12$..."."""
+    return int(hashed.split("$")[2])
+
+
+@pytest.fixture(scope="module")
+def sample_hash() -> str:
+    """Hash the sample password once for all password hashing tests."""
+    return get_password_hash(SAMPLE_PASSWORD)
+
+
+@pytest.fixture(scope="module")
+def access_token() -> str:
+    """Create one access token for the JWT tests."""
+    return create_access_token(data={"sub": "testuser"})
+
+
+@pytest.fixture(scope="module")
+def decoded_access_token(access_token: str) -> dict:
+    """Decode the shared access token once for the JWT tests."""
+    return jwt.decode(access_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
 
 
 class TestPasswordHashing:
     """Tests for password hashing utilities."""
 
-    def test_hash_and_verify_password(self):
+    def test_hash_and_verify_password(self, sample_hash):
         """Test that password hashing and verification works."""
-        password = "securepassword123"
-        hashed = get_password_hash(password)
+        assert sample_hash != SAMPLE_PASSWORD
+        assert verify_password(SAMPLE_PASSWORD, sample_hash) is True
+        assert verify_password("wrongpassword", sample_hash) is False
 
-        assert hashed != password
-        assert verify_password(password, hashed) is True
-        assert verify_password("wrongpassword", hashed) is False
-
-    def test_different_hashes_for_same_password(self):
+    def test_different_hashes_for_same_password(self, sample_hash):
         """Test that same password produces different hashes (due to salt)."""
-        password = "securepassword123"
-        hash1 = get_password_hash(password)
-        hash2 = get_password_hash(password)
+        other_hash = get_password_hash(SAMPLE_PASSWORD)
 
-        assert hash1 != hash2
-        assert verify_password(password, hash1) is True
-        assert verify_password(password, hash2) is True
+        assert other_hash != sample_hash
+        assert verify_password(SAMPLE_PASSWORD, other_hash) is True
 
-    def test_hash_is_bcrypt_format(self):
+    def test_hash_is_bcrypt_format(self, sample_hash):
         """Test that the hash is in bcrypt format."""
-        password = "test"
-        hashed = get_password_hash(password)
         # Bcrypt hashes start with $2a$, $2b$, or $2y$
-        assert hashed.startswith("$2")
+        assert sample_hash.startswith("$2")
+
+    def test_hash_uses_configured_rounds(self, sample_hash):
+        """Test that hashes use the work factor configured on the context (the minimum of 4 under test)."""
+        assert bcrypt_rounds(sample_hash) == pwd_context.handler("bcrypt").default_rounds
+
+    def test_verifies_hash_from_bcrypt_library(self):
+        """Test that hashes made by the bcrypt library directly verify, with whatever work factor they carry."""
+        hashed = bcrypt.hashpw(SAMPLE_PASSWORD.encode(), bcrypt.gensalt(rounds=5)).decode()
+
+        assert verify_password(SAMPLE_PASSWORD, hashed) is True
+        assert verify_password("wrongpassword", hashed) is False
 
 
 class TestJWTTokens:
     """Tests for JWT token creation."""
 
-    def test_create_access_token(self):
+    def test_create_access_token(self, access_token):
         """Test creating an access token."""
-        token = create_access_token(data={"sub": "testuser"})
-        assert token is not None
-        assert isinstance(token, str)
-        assert len(token) > 0
+        assert access_token is not None
+        assert isinstance(access_token, str)
+        assert len(access_token) > 0
 
-    def test_create_access_token_contains_subject(self):
+    def test_create_access_token_contains_subject(self, decoded_access_token):
         """Test that access token can be decoded to get subject."""
-        from jose import jwt
-
-        token = create_access_token(data={"sub": "testuser"})
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-
-        assert payload["sub"] == "testuser"
-        assert "exp" in payload
+        assert decoded_access_token["sub"] == "testuser"
+        assert "exp" in decoded_access_token
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestAuthEndpoints:
     """Integration tests for auth endpoints."""
 
     @pytest.mark.asyncio
-    async def test_register_user_password_too_short(self):
+    async def test_register_user_password_too_short(self, anon_client):
         """Test registration with password that's too short."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/auth/register",
-                json={
-                    "password": "short",  # Too short
-                    "email": "newuser@example.com",
-                },
-            )
-
-            assert response.status_code == 422  # Validation error
+        response = await anon_client.post(
+            "/api/auth/register",
+            json={
+                "password": "short",  # Too short
+                "email": "newuser@example.com",
+            },
+        )
+
+        assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_login_without_credentials(self):
+    async def test_login_without_credentials(self, anon_client):
         """Test login without credentials."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/auth/login",
-                json={},  # No credentials
-            )
+        response = await anon_client.post(
+            "/api/auth/login",
+            json={},  # No credentials
+        )
 
-            assert response.status_code == 422  # Validation error
+        assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
     async def test_protected_endpoint_without_token(self):
         """Test accessing protected endpoint without token."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/auth/me")
+        status = await asgi_status(app, "GET", "/api/auth/me")
 
-            assert response.status_code == 401
+        assert status == 401
 
     @pytest.mark.asyncio
     async def test_protected_endpoint_with_invalid_token(self):
         """Test accessing protected endpoint with invalid token."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/auth/me",
-                headers={"Authorization": "Bearer invalidtoken"},
-            )
+        status = await asgi_status(
+            app,
+            "GET",
+            "/api/auth/me",
+            headers={"Authorization": "Bearer invalidtoken"},
+        )
 
-            assert response.status_code == 401
+        assert status == 401
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestLogout:
     """Tests for logout endpoint."""
 
     @pytest.mark.asyncio
     async def test_logout_without_auth(self):
         """Test logout without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post("/api/auth/logout")
+        status = await asgi_status(app, "POST", "/api/auth/logout")
 
-            assert response.status_code == 401
+        assert status == 401
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestTokenRefresh:
     """Tests for token refresh endpoint.
 
@@ -132,16 +151,15 @@ class TestTokenRefresh:
     """
 
     @pytest.mark.asyncio
-    async def test_token_refresh_endpoint_not_found(self):
+    async def test_token_refresh_endpoint_not_found(self, anon_client):
         """Test that token refresh endpoint returns 404 (not implemented in new router)."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post("/api/auth/token/refresh")
+        response = await anon_client.post("/api/auth/token/refresh")
 
-            # Endpoint doesn't exist in the new auth router
-            assert response.status_code == 404
+        # Endpoint doesn't exist in the new auth router
+        assert response.status_code == 404
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestUpdateMe:
     """Tests for PATCH /me endpoint.
 
@@ -150,19 +168,17 @@ class TestUpdateMe:
     """
 
     @pytest.mark.asyncio
-    async def test_update_me_endpoint_not_allowed(self):
+    async def test_update_me_endpoint_not_allowed(self, anon_client):
         """Test that PATCH /me returns 405 (not implemented in new router)."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.patch(
-                "/api/auth/me",
-                json={
-                    "email": "newemail@example.com",
-                },
-            )
+        response = await anon_client.patch(
+            "/api/auth/me",
+            json={
+                "email": "newemail@example.com",
+            },
+        )
 
-            # PATCH method not allowed - endpoint only supports GET in new router
-            assert response.status_code == 405
+        # PATCH method not allowed - endpoint only supports GET in new router
+        assert response.status_code == 405
 
 
 class TestPasswordReset:
@@ -217,6 +233,7 @@ class TestPasswordReset:
         assert response.status_code == 400
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestValidateResetToken:
     """Tests for validate_reset_token endpoint.
 
@@ -225,20 +242,18 @@ class TestValidateResetToken:
     """
 
     @pytest.mark.asyncio
-    async def test_validate_reset_token_endpoint_not_found(self):
+    async def test_validate_reset_token_endpoint_not_found(self, anon_client):
         """Test that validate reset token endpoint returns 404 (not implemented in new router)."""
         from base64 import urlsafe_b64encode
 
         uidb64 = urlsafe_b64encode(b"1").decode()
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                f"/api/auth/password-reset-validate/{uidb64}/some-token",
-            )
+        response = await anon_client.get(
+            f"/api/auth/password-reset-validate/{uidb64}/some-token",
+        )
 
-            # Endpoint doesn't exist in the new auth router
-            assert response.status_code == 404
+        # Endpoint doesn't exist in the new auth router
+        assert response.status_code == 404
 
 
 class TestAuthEndpointsAuthenticated:
@@ -1,90 +1,49 @@
 """Tests for bank accounts router."""
 
 import pytest
-from httpx import ASGITransport, AsyncClient
 
 from main import app
+from tests.utils import asgi_status
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestBankAccountsEndpoints:
     """Integration tests for bank accounts endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_bank_accounts_without_auth(self):
-        """Test getting bank accounts without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/bank-accounts")
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_create_bank_account_without_auth(self):
-        """Test creating bank account without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            pytest.param("GET", "/api/bank-accounts", {}, id="get_bank_accounts"),
+            pytest.param(
+                "POST",
                 "/api/bank-accounts",
-                json={
-                    "account_number": "BE12345678901234",
-                    "alias": "My Savings",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_get_specific_bank_account_without_auth(self):
-        """Test getting specific bank account without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/bank-accounts/BE12345678901234")
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_update_bank_account_without_auth(self):
-        """Test updating bank account without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.patch(
+                {"json_body": {"account_number": "BE12345678901234", "alias": "My Savings"}},
+                id="create_bank_account",
+            ),
+            pytest.param("GET", "/api/bank-accounts/BE12345678901234", {}, id="get_specific_bank_account"),
+            pytest.param(
+                "PATCH",
                 "/api/bank-accounts/BE12345678901234",
-                json={
-                    "alias": "Updated Alias",
-                },
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_delete_bank_account_without_auth(self):
-        """Test deleting bank account without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.delete("/api/bank-accounts/BE12345678901234")
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_save_alias_without_auth(self):
-        """Test saving alias without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
+                {"json_body": {"alias": "Updated Alias"}},
+                id="update_bank_account",
+            ),
+            pytest.param("DELETE", "/api/bank-accounts/BE12345678901234", {}, id="delete_bank_account"),
+            pytest.param(
+                "POST",
                 "/api/bank-accounts/save-alias",
-                json={
-                    "alias": "New Alias",
-                    "bank_account": "BE12345678901234",
-                },
-            )
-
-            assert response.status_code == 401
+                {"json_body": {"alias": "New Alias", "bank_account": "BE12345678901234"}},
+                id="save_alias",
+            ),
+        ],
+    )
+    async def test_endpoint_requires_auth(self, method, path, kwargs):
+        """Test that bank accounts endpoints reject requests without authentication."""
+        assert await asgi_status(app, method, path, **kwargs) == 401
 
 
 class TestBankAccountsEndpointsAuthenticated:
     """Tests for bank accounts endpoints with authentication."""
 
-    @pytest.mark.asyncio
     async def test_get_bank_accounts_with_auth(self, authenticated_client):
         """Test getting bank accounts with authentication."""
         client, access_token = authenticated_client
@@ -95,7 +54,6 @@ class TestBankAccountsEndpointsAuthenticated:
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
-    @pytest.mark.asyncio
     async def test_create_bank_account_with_auth(self, authenticated_client):
         """Test creating bank account with authentication."""
         client, access_token = authenticated_client
@@ -114,7 +72,6 @@ class TestBankAccountsEndpointsAuthenticated:
         data = response.json()
         assert "account_number" in data
 
-    @pytest.mark.asyncio
     async def test_get_specific_bank_account_with_auth(
         self, authenticated_client, seed_bank_account
     ):
@@ -132,7 +89,6 @@ class TestBankAccountsEndpointsAuthenticated:
         data = response.json()
         assert "account_number" in data
 
-    @pytest.mark.asyncio
     async def test_get_specific_bank_account_not_found(self, authenticated_client):
         """Test getting bank account that doesn't exist."""
         client, access_token = authenticated_client
@@ -146,7 +102,6 @@ class TestBankAccountsEndpointsAuthenticated:
         # Should be 404 (not found) or 403 (forbidden)
         assert response.status_code in [403, 404]
 
-    @pytest.mark.asyncio
     async def test_update_bank_account_with_auth(
         self, authenticated_client, seed_bank_account
     ):
@@ -167,7 +122,6 @@ class TestBankAccountsEndpointsAuthenticated:
         data = response.json()
         assert data.get("alias") == "Updated Test Alias"
 
-    @pytest.mark.asyncio
     async def test_save_alias_with_auth(self, authenticated_client, seed_bank_account):
         """Test saving alias with authentication."""
         client, access_token = authenticated_client
@@ -185,7 +139,6 @@ class TestBankAccountsEndpointsAuthenticated:
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_delete_bank_account_with_auth(
         self, authenticated_client, seed_bank_account
     ):
@@ -1,98 +1,65 @@
 """Tests for categories router."""
 
 import pytest
-from httpx import ASGITransport, AsyncClient
 
 from main import app
+from tests.utils import asgi_status
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestCategoriesEndpoints:
     """Integration tests for categories endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_category_tree_without_auth(self):
-        """Test getting category tree without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/categories/tree",
-                params={"transaction_type": "EXPENSES"},
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_get_category_tree_invalid_type(self):
-        """Test getting category tree with invalid transaction type."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/categories/tree",
-                params={"transaction_type": "INVALID"},
-            )
-
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
-
-    @pytest.mark.asyncio
-    async def test_get_category_tree_both_type_rejected(self):
-        """Test that BOTH transaction type is rejected for tree."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/categories/tree",
-                params={"transaction_type": "BOTH"},
-            )
-
-            # Should fail (400) or auth (401)
-            assert response.status_code in [400, 401]
-
-    @pytest.mark.asyncio
-    async def test_list_categories_without_auth(self):
-        """Test listing categories without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/categories")
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_list_categories_with_filter_without_auth(self):
-        """Test listing categories with type filter without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            pytest.param(
+                "GET", "/api/categories/tree", {"params": {"transaction_type": "EXPENSES"}}, id="get_category_tree"
+            ),
+            pytest.param("GET", "/api/categories", {}, id="list_categories"),
+            pytest.param(
+                "GET",
                 "/api/categories",
-                params={"transaction_type": "EXPENSES"},
-            )
-
-            assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_get_category_by_id_without_auth(self):
-        """Test getting category by ID without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/categories/1")
+                {"params": {"transaction_type": "EXPENSES"}},
+                id="list_categories_with_filter",
+            ),
+            pytest.param("GET", "/api/categories/1", {}, id="get_category_by_id"),
+            pytest.param(
+                "GET",
+                "/api/categories/by-qualified-name/expenses/groceries",
+                {},
+                id="get_category_by_qualified_name",
+            ),
+        ],
+    )
+    async def test_endpoint_requires_auth(self, method, path, kwargs):
+        """Test that categories endpoints reject requests without authentication."""
+        assert await asgi_status(app, method, path, **kwargs) == 401
+
+    async def test_get_category_tree_invalid_type(self, anon_client):
+        """Test getting category tree with invalid transaction type."""
+        response = await anon_client.get(
+            "/api/categories/tree",
+            params={"transaction_type": "INVALID"},
+        )
 
-            assert response.status_code == 401
+        # Should fail validation (422) or auth (401)
+        assert response.status_code in [401, 422]
 
-    @pytest.mark.asyncio
-    async def test_get_category_by_qualified_name_without_auth(self):
-        """Test getting category by qualified name without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/categories/by-qualified-name/expenses/groceries"
-            )
+    async def test_get_category_tree_both_type_rejected(self, anon_client):
+        """Test that BOTH transaction type is rejected for tree."""
+        response = await anon_client.get(
+            "/api/categories/tree",
+            params={"transaction_type": "BOTH"},
+        )
 
-            assert response.status_code == 401
+        # Should fail (400) or auth (401)
+        assert response.status_code in [400, 401]
 
 
 class TestCategoriesEndpointsAuthenticated:
     """Tests for categories endpoints with authentication."""
 
-    @pytest.mark.asyncio
     async def test_get_category_tree_with_auth(self, authenticated_client):
         """Test getting category tree with authentication."""
         client, access_token = authenticated_client
@@ -110,7 +77,6 @@ class TestCategoriesEndpointsAuthenticated:
             data = response.json()
             assert isinstance(data, dict)
 
-    @pytest.mark.asyncio
     async def test_list_categories_with_auth(self, authenticated_client):
         """Test listing categories with authentication."""
         client, access_token = authenticated_client
@@ -122,7 +88,6 @@ class TestCategoriesEndpointsAuthenticated:
         data = response.json()
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
     async def test_list_categories_with_filter_with_auth(self, authenticated_client):
         """Test listing categories with type filter with authentication."""
         client, access_token = authenticated_client
@@ -138,7 +103,6 @@ class TestCategoriesEndpointsAuthenticated:
         data = response.json()
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
     async def test_get_category_by_id_with_auth(self, authenticated_client):
         """Test getting category by ID with authentication."""
         client, access_token = authenticated_client
@@ -161,7 +125,6 @@ class TestCategoriesEndpointsAuthenticated:
                     data = response.json()
                     assert data.get("id") == category_id
 
-    @pytest.mark.asyncio
     async def test_get_category_by_id_not_found(self, authenticated_client):
         """Test getting category by ID that doesn't exist."""
         client, access_token = authenticated_client
@@ -171,7 +134,6 @@ class TestCategoriesEndpointsAuthenticated:
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_category_by_qualified_name_with_auth(self, authenticated_client):
         """Test getting category by qualified name with authentication."""
         client, access_token = authenticated_client
@@ -196,7 +158,6 @@ class TestCategoriesEndpointsAuthenticated:
                         assert data.get("qualified_name") == qualified_name
                     break
 
-    @pytest.mark.asyncio
     async def test_get_category_by_qualified_name_not_found(self, authenticated_client):
         """Test getting category by qualified name that doesn't exist."""
         client, access_token = authenticated_client
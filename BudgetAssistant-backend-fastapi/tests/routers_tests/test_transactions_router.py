@@ -6,11 +6,9 @@ from datetime import date
 import factory
 import pytest
 from factory.alchemy import SQLAlchemyModelFactory
-from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
 
 from common.enums import TransactionTypeEnum
-from main import app
 from models import BankAccount, Category, Counterparty, Transaction, User
 from models.associations import UserBankAccountLink
 
@@ -122,190 +120,119 @@ async def seed_transaction_data(test_session_maker) -> dict:
         }
 
 
+@pytest.mark.xdist_group("anon_http")
 class TestTransactionsEndpoints:
     """Integration tests for transactions endpoints."""
 
     @pytest.mark.asyncio
-    async def test_page_transactions_without_auth(self):
+    async def test_page_transactions_without_auth(self, anon_client):
         """Test paging transactions without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page",
-                json={
-                    "page": 0,
-                    "size": 10,
-                    "sort_order": "asc",
-                    "sort_property": "transaction_id",
-                },
-            )
+        response = await anon_client.post(
+            "/api/transactions/page",
+            json={
+                "page": 0,
+                "size": 10,
+                "sort_order": "asc",
+                "sort_property": "transaction_id",
+            },
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_page_transactions_in_context_without_auth(self):
+    async def test_page_transactions_in_context_without_auth(self, anon_client):
         """Test paging transactions in context without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page-in-context",
-                json={
-                    "page": 0,
-                    "size": 10,
-                    "sort_order": "asc",
-                    "sort_property": "transaction_id",
-                    "query": {
-                        "bank_account": "BE12345",
-                        "period": "2023-01",
-                        "start_date": "2023-01-01",
-                        "end_date": "2023-01-31",
-                        "transaction_type": "EXPENSES",
-                        "category_id": 1,
-                    },
+        response = await anon_client.post(
+            "/api/transactions/page-in-context",
+            json={
+                "page": 0,
+                "size": 10,
+                "sort_order": "asc",
+                "sort_property": "transaction_id",
+                "query": {
+                    "bank_account": "BE12345",
+                    "period": "2023-01",
+                    "start_date": "2023-01-01",
+                    "end_date": "2023-01-31",
+                    "transaction_type": "EXPENSES",
+                    "category_id": 1,
                 },
-            )
+            },
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_page_to_manually_review_without_auth(self):
+    async def test_page_to_manually_review_without_auth(self, anon_client):
         """Test paging transactions to review without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page-uncategorized",
-                json={
-                    "page": 0,
-                    "size": 10,
-                    "bank_account": "BE12345",
-                    "transaction_type": "EXPENSES",
-                },
-            )
+        response = await anon_client.post(
+            "/api/transactions/page-uncategorized",
+            json={
+                "page": 0,
+                "size": 10,
+                "bank_account": "BE12345",
+                "transaction_type": "EXPENSES",
+            },
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_count_to_manually_review_without_auth(self):
+    async def test_count_to_manually_review_without_auth(self, anon_client):
         """Test counting transactions to review without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/transactions/count-uncategorized",
-                params={"bank_account": "BE12345"},
-            )
+        response = await anon_client.get(
+            "/api/transactions/count-uncategorized",
+            params={"bank_account": "BE12345"},
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_save_transaction_without_auth(self):
+    async def test_save_transaction_without_auth(self, anon_client):
         """Test saving transaction without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/save",
-                params={"transaction_id": "txn123"},
-                json={
-                    "category_id": 1,
-                    "manually_assigned_category": True,
-                },
-            )
+        response = await anon_client.post(
+            "/api/transactions/save",
+            params={"transaction_id": "txn123"},
+            json={
+                "category_id": 1,
+                "manually_assigned_category": True,
+            },
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_upload_transactions_without_auth(self):
+    async def test_upload_transactions_without_auth(self, anon_client):
         """Test uploading transactions without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Create a simple CSV content
-            csv_content = b"header1,header2\nvalue1,value2\n"
-
-            response = await client.post(
-                "/api/transactions/upload",
-                files={"files": ("test.csv", csv_content, "text/csv")},
-            )
+        # Create a simple CSV content
+        csv_content = b"header1,header2\nvalue1,value2\n"
 
-            assert response.status_code == 401
+        response = await anon_client.post(
+            "/api/transactions/upload",
+            files={"files": ("test.csv", csv_content, "text/csv")},
+        )
+
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_distinct_counterparty_names_without_auth(self):
+    async def test_distinct_counterparty_names_without_auth(self, anon_client):
         """Test getting distinct counterparty names without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/transactions/distinct-counterparty-names",
-                params={"bank_account": "BE12345"},
-            )
+        response = await anon_client.get(
+            "/api/transactions/distinct-counterparty-names",
+            params={"bank_account": "BE12345"},
+        )
 
-            assert response.status_code == 401
+        assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_distinct_counterparty_accounts_without_auth(self):
+    async def test_distinct_counterparty_accounts_without_auth(self, anon_client):
         """Test getting distinct counterparty accounts without authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/transactions/distinct-counterparty-accounts",
-                params={"bank_account": "BE12345"},
-            )
-
-            assert response.status_code == 401
-
-
-class TestTransactionQueryValidation:
-    """Tests for transaction query validation."""
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_invalid_sort_order(self):
-        """Test that invalid sort order is rejected."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page",
-                json={
-                    "page": 0,
-                    "size": 10,
-                    "sort_order": "invalid",  # Invalid sort order
-                    "sort_property": "transaction_id",
-                },
-            )
-
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_invalid_sort_property(self):
-        """Test that invalid sort property is rejected."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page",
-                json={
-                    "page": 0,
-                    "size": 10,
-                    "sort_order": "asc",
-                    "sort_property": "invalid_property",  # Invalid property
-                },
-            )
-
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_negative_page(self):
-        """Test that negative page number is rejected."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/transactions/page",
-                json={
-                    "page": -1,  # Invalid negative page
-                    "size": 10,
-                },
-            )
+        response = await anon_client.get(
+            "/api/transactions/distinct-counterparty-accounts",
+            params={"bank_account": "BE12345"},
+        )
 
-            # Should fail validation (422) or auth (401)
-            assert response.status_code in [401, 422]
+        assert response.status_code == 401
 
 
 class TestTransactionsEndpointsAuthenticated:
@@ -389,14 +316,15 @@ class TestTransactionsEndpointsAuthenticated:
             bank_account = BankAccountFactory.build(account_number=account_number, alias="Test Account")
             counterparty = CounterpartyFactory.build(name="Acme Corp", account_number="CP-123")
 
-            session.add_all([bank_account, counterparty])
-            await session.flush()
-
-            session.add(
-                UserBankAccountLink(
-                    user_id=user.id,
-                    bank_account_number=account_number,
-                )
+            session.add_all(
+                [
+                    bank_account,
+                    counterparty,
+                    UserBankAccountLink(
+                        user_id=user.id,
+                        bank_account_number=account_number,
+                    ),
+                ]
             )
 
             transactions = TransactionFactory.build_batch(
@@ -443,14 +371,15 @@ class TestTransactionsEndpointsAuthenticated:
             bank_account = BankAccountFactory.build(account_number=account_number, alias="Test Account")
             counterparty = CounterpartyFactory.build(name="Acme Corp", account_number="CP-123")
 
-            session.add_all([bank_account, counterparty])
-            await session.flush()
-
-            session.add(
-                UserBankAccountLink(
-                    user_id=user.id,
-                    bank_account_number=account_number,
-                )
+            session.add_all(
+                [
+                    bank_account,
+                    counterparty,
+                    UserBankAccountLink(
+                        user_id=user.id,
+                        bank_account_number=account_number,
+                    ),
+                ]
             )
 
             transactions = TransactionFactory.build_batch(
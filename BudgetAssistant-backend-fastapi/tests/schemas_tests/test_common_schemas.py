@@ -3,6 +3,7 @@
 from datetime import date, datetime
 
 import pytest
+from pydantic import ValidationError
 
 from common.enums import RecurrenceType, TransactionTypeEnum
 from schemas.common import (
@@ -167,6 +168,25 @@ class TestPageTransactionsRequest:
         request = PageTransactionsRequest()
         assert request.query is None
 
+    def test_invalid_sort_order_rejected(self):
+        """Test that an invalid sort order is rejected."""
+        with pytest.raises(ValidationError):
+            PageTransactionsRequest.model_validate(
+                {"page": 0, "size": 10, "sort_order": "invalid", "sort_property": "transaction_id"}
+            )
+
+    def test_invalid_sort_property_rejected(self):
+        """Test that an invalid sort property is rejected."""
+        with pytest.raises(ValidationError):
+            PageTransactionsRequest.model_validate(
+                {"page": 0, "size": 10, "sort_order": "asc", "sort_property": "invalid_property"}
+            )
+
+    def test_negative_page_rejected(self):
+        """Test that a negative page number is rejected."""
+        with pytest.raises(ValidationError):
+            PageTransactionsRequest.model_validate({"page": -1, "size": 10})
+
 
 class TestRevenueExpensesQuery:
     """Tests for RevenueExpensesQuery."""
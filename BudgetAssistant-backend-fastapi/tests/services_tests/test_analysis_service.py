@@ -362,8 +362,9 @@ async def create_test_data(
 
     # Create bank account (use lowercase for consistency with normalize_account_number)
     bank_account = BankAccount(account_number="test123456", alias="Test Account")
-    session.add(bank_account)
-    await session.flush()
+    # Create counterparty (needed for transactions)
+    counterparty = Counterparty(name="test_counterparty", account_number="CP123456")
+    session.add_all([bank_account, counterparty])
 
     # Create categories
     category_dict: Dict[str, Category] = {}
@@ -379,11 +380,7 @@ async def create_test_data(
         session.add(category)
         category_dict[category_name] = category
 
-    await session.flush()
-
-    # Create counterparty (needed for transactions)
-    counterparty = Counterparty(name="test_counterparty", account_number="CP123456")
-    session.add(counterparty)
+    # Flush once so the generated category ids are available to the transactions
     await session.flush()
 
     # Create transactions from DataFrame
@@ -413,7 +410,6 @@ async def create_test_data(
         transactions.append(transaction)
 
     await session.flush()
-    await session.commit()
 
     return bank_account, category_dict, transactions
 
@@ -20,8 +20,7 @@ async def user(async_session: AsyncSession) -> User:
         password_hash="hashed_password123",
     )
     async_session.add(user)
-    await async_session.commit()
-    await async_session.refresh(user)
+    await async_session.flush()
     return user
 
 
@@ -58,7 +57,7 @@ class TestBankAccountService:
         # Create existing bank account
         existing_account = BankAccount(account_number=account_number)
         async_session.add(existing_account)
-        await async_session.commit()
+        await async_session.flush()
 
         # Get or create should return existing and add user
         bank_account = await service.get_or_create_bank_account(account_number, user, async_session)
@@ -77,15 +76,12 @@ class TestBankAccountService:
 
         # Create bank account and associate with user
         bank_account = BankAccount(account_number=account_number)
-        async_session.add(bank_account)
-        await async_session.flush()
-
         link = UserBankAccountLink(
             user_id=user.id,
             bank_account_number=account_number,
         )
-        async_session.add(link)
-        await async_session.commit()
+        async_session.add_all([bank_account, link])
+        await async_session.flush()
 
         # Find accounts for user
         accounts = await service.find_by_user(user, async_session)
@@ -100,7 +96,7 @@ class TestBankAccountService:
         # Create bank account
         bank_account = BankAccount(account_number=account_number)
         async_session.add(bank_account)
-        await async_session.commit()
+        await async_session.flush()
 
         # Retrieve account
         retrieved_account = await service.get_bank_account(account_number, async_session)
@@ -126,7 +122,7 @@ class TestBankAccountService:
         # Create bank account
         bank_account = BankAccount(account_number=account_number)
         async_session.add(bank_account)
-        await async_session.commit()
+        await async_session.flush()
 
         # Save alias
         updated_account = await service.save_alias(account_number, alias, async_session)
@@ -168,7 +164,7 @@ class TestBankAccountService:
         # Create bank account without associating user
         bank_account = BankAccount(account_number=account_number)
         async_session.add(bank_account)
-        await async_session.commit()
+        await async_session.flush()
 
         # Check access
         has_access = await service.user_has_access(user, account_number, async_session)
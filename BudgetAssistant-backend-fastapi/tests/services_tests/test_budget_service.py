@@ -115,7 +115,7 @@ async def create_category_hierarchy(
     categories["fuel"] = fuel
     categories["public_transport"] = public_transport
 
-    await session.commit()
+    await session.flush()
     return categories
 
 
@@ -216,7 +216,7 @@ async def create_budget_tree(
         number_of_descendants=6,
     )
     session.add(budget_tree)
-    await session.commit()
+    await session.flush()
 
     return budget_tree, nodes
 
@@ -270,7 +270,7 @@ async def create_test_transactions(
         session.add(tx)
         transactions.append(tx)
 
-    await session.commit()
+    await session.flush()
     return transactions
 
 
@@ -289,15 +289,11 @@ async def budget_test_data(
     Returns:
         Tuple of (bank_account, categories, budget_tree, budget_nodes, transactions).
     """
-    # Create bank account (lowercase for normalization)
+    # Create bank account (lowercase for normalization) and counterparty; both have natural keys,
+    # so they are flushed together with the category hierarchy below
     bank_account = BankAccount(account_number="budget_test_123", alias="Budget Test Account")
-    async_session.add(bank_account)
-    await async_session.flush()
-
-    # Create counterparty
     counterparty = Counterparty(name="budget_test_counterparty", account_number="CP_BUDGET")
-    async_session.add(counterparty)
-    await async_session.flush()
+    async_session.add_all([bank_account, counterparty])
 
     # Create category hierarchy
     categories = await create_category_hierarchy(async_session)
@@ -438,7 +434,7 @@ class TestTrackBudget:
         # Create bank account without budget tree
         bank_account = BankAccount(account_number="no_budget_account", alias="No Budget")
         async_session.add(bank_account)
-        await async_session.commit()
+        await async_session.flush()
 
         query = RevenueExpensesQuery(
             account_number=bank_account.account_number,
@@ -499,7 +495,7 @@ class TestTrackBudget:
             root_id=root_node.id,
         )
         async_session.add(budget_tree)
-        await async_session.commit()
+        await async_session.flush()
 
         query = RevenueExpensesQuery(
             account_number=bank_account.account_number,
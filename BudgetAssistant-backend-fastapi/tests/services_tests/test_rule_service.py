@@ -165,7 +165,7 @@ def create_rule_set_wrapper_with_rule(category: Category, rule_values: list[str]
     wrapper = RuleSetWrapper(
         id=category.id,
         category_id=category.id,
-        rule_set_json=json.dumps(rule_set.model_dump()),
+        rule_set_json=rule_set.model_dump_json(),
     )
     wrapper.category = category
     return wrapper
@@ -179,19 +179,20 @@ class TestRuleSetWrappersPostOrderTraverser:
         sample_expenses_category_tree: CategoryTree,
         sample_revenue_category_tree: CategoryTree,
     ):
-        """Test that initialization creates NetworkX graphs."""
+        """Test that initialization flattens the trees into post-order node lists."""
         traverser = RuleSetWrappersPostOrderTraverser(
             expenses_category_tree=sample_expenses_category_tree,
             revenue_category_tree=sample_revenue_category_tree,
             rule_set_wrappers=[],
         )
 
-        assert traverser.expenses_category_tree is not None
-        assert traverser.revenue_category_tree is not None
         # Expenses tree has 4 nodes (root, groceries, transport, fuel)
-        assert len(traverser.expenses_category_tree.nodes()) == 4
+        assert len(traverser.expenses_nodes) == 4
         # Revenue tree has 2 nodes (root, salary)
-        assert len(traverser.revenue_category_tree.nodes()) == 2
+        assert len(traverser.revenue_nodes) == 2
+        # Children come before their parents, the root comes last
+        assert [c.name for c in traverser.expenses_nodes] == ["Groceries", "Fuel", "Transport", "Expenses"]
+        assert [c.name for c in traverser.revenue_nodes] == ["Salary", "Revenue"]
 
     def test_traverse_without_transaction_raises_error(
         self,
@@ -249,15 +250,25 @@ class TestRuleSetWrappersPostOrderTraverser:
         assert result.name == "Groceries"
         assert sample_transaction.category == groceries
 
-    def test_traverse_uses_correct_tree_for_expense(
+    @pytest.mark.parametrize(
+        "amount,expected_type,expected_root",
+        [
+            (-50.0, TransactionTypeEnum.EXPENSES, "Expenses"),
+            (1000.0, TransactionTypeEnum.REVENUE, "Revenue"),
+        ],
+    )
+    def test_traverse_uses_correct_tree(
         self,
         sample_expenses_category_tree: CategoryTree,
         sample_revenue_category_tree: CategoryTree,
         sample_transaction: Transaction,
+        amount: float,
+        expected_type: TransactionTypeEnum,
+        expected_root: str,
     ):
-        """Test that expense transactions use expense tree."""
-        # Transaction has negative amount, so it's an expense
-        assert sample_transaction.get_transaction_type() == TransactionTypeEnum.EXPENSES
+        """Test that expense transactions use the expense tree and revenue transactions the revenue tree."""
+        sample_transaction.amount = amount
+        assert sample_transaction.get_transaction_type() == expected_type
 
         traverser = RuleSetWrappersPostOrderTraverser(
             expenses_category_tree=sample_expenses_category_tree,
@@ -266,35 +277,14 @@ class TestRuleSetWrappersPostOrderTraverser:
         )
         traverser.set_current_transaction(sample_transaction)
 
-        tree = traverser.get_category_tree()
+        nodes = traverser.get_category_nodes()
         root = traverser.get_root_category()
 
-        assert tree == traverser.expenses_category_tree
-        assert root.name == "Expenses"
-
-    def test_traverse_uses_correct_tree_for_revenue(
-        self,
-        sample_expenses_category_tree: CategoryTree,
-        sample_revenue_category_tree: CategoryTree,
-        sample_transaction: Transaction,
-    ):
-        """Test that revenue transactions use revenue tree."""
-        # Change to positive amount for revenue
-        sample_transaction.amount = 1000.00
-        assert sample_transaction.get_transaction_type() == TransactionTypeEnum.REVENUE
-
-        traverser = RuleSetWrappersPostOrderTraverser(
-            expenses_category_tree=sample_expenses_category_tree,
-            revenue_category_tree=sample_revenue_category_tree,
-            rule_set_wrappers=[],
+        expected_nodes = (
+            traverser.expenses_nodes if expected_type == TransactionTypeEnum.EXPENSES else traverser.revenue_nodes
         )
-        traverser.set_current_transaction(sample_transaction)
-
-        tree = traverser.get_category_tree()
-        root = traverser.get_root_category()
-
-        assert tree == traverser.revenue_category_tree
-        assert root.name == "Revenue"
+        assert nodes == expected_nodes
+        assert root.name == expected_root
 
     def test_post_order_traversal_checks_children_before_parent(
         self,
@@ -327,6 +317,111 @@ class TestRuleSetWrappersPostOrderTraverser:
         assert result is not None
         assert result.name == "Fuel"
 
+    def test_wrappers_are_matched_by_category_id(
+        self,
+        sample_expenses_category_tree: CategoryTree,
+        sample_revenue_category_tree: CategoryTree,
+        sample_transaction: Transaction,
+    ):
+        """Test that wrappers are looked up by category_id, without needing the category relationship."""
+        groceries = sample_expenses_category_tree.root.children[0]
+        wrapper = create_rule_set_wrapper_with_rule(groceries, ["Groceries"])
+        wrapper.category = None
+
+        traverser = RuleSetWrappersPostOrderTraverser(
+            expenses_category_tree=sample_expenses_category_tree,
+            revenue_category_tree=sample_revenue_category_tree,
+            rule_set_wrappers=[wrapper],
+        )
+        traverser.set_current_transaction(sample_transaction)
+
+        assert traverser.rules_by_category_id == {groceries.id: wrapper}
+        result = traverser.traverse()
+        assert result is not None
+        assert result.name == "Groceries"
+
+    def test_literal_rules_are_indexed(
+        self,
+        sample_expenses_category_tree: CategoryTree,
+        sample_revenue_category_tree: CategoryTree,
+    ):
+        """Test that plain-literal rules go to the inverted index and regex-like rules are evaluated fully."""
+        groceries = sample_expenses_category_tree.root.children[0]
+        transport = sample_expenses_category_tree.root.children[1]
+
+        traverser = RuleSetWrappersPostOrderTraverser(
+            expenses_category_tree=sample_expenses_category_tree,
+            revenue_category_tree=sample_revenue_category_tree,
+            rule_set_wrappers=[
+                create_rule_set_wrapper_with_rule(groceries, ["Groceries", "Supermarket"]),
+                create_rule_set_wrapper_with_rule(transport, ["fuel station"]),
+            ],
+        )
+
+        assert traverser.easy_category_ids == {groceries.id}
+        assert traverser.literal_index["communications"] == {"groceries": {groceries.id}, "supermarket": {groceries.id}}
+        assert set(traverser.hard_rule_sets) == {transport.id}
+
+    def test_hard_rules_fall_back_to_full_evaluation(
+        self,
+        sample_expenses_category_tree: CategoryTree,
+        sample_revenue_category_tree: CategoryTree,
+        sample_transaction: Transaction,
+    ):
+        """Test that rules with whitespace keep their regex semantics (spaces match any whitespace)."""
+        transport = sample_expenses_category_tree.root.children[1]
+        sample_transaction.communications = "FUEL   STATION 42"
+
+        traverser = RuleSetWrappersPostOrderTraverser(
+            expenses_category_tree=sample_expenses_category_tree,
+            revenue_category_tree=sample_revenue_category_tree,
+            rule_set_wrappers=[create_rule_set_wrapper_with_rule(transport, ["fuel station"])],
+        )
+        traverser.set_current_transaction(sample_transaction)
+
+        result = traverser.traverse()
+        assert result is not None
+        assert result.name == "Transport"
+
+    def test_set_current_transaction_lowercases_indexed_fields(
+        self,
+        sample_expenses_category_tree: CategoryTree,
+        sample_revenue_category_tree: CategoryTree,
+        sample_transaction: Transaction,
+    ):
+        """Test that fields used by literal rules are lowercased once when the transaction is set."""
+        groceries = sample_expenses_category_tree.root.children[0]
+        sample_transaction.communications = "Payment at SUPERMARKET"
+
+        traverser = RuleSetWrappersPostOrderTraverser(
+            expenses_category_tree=sample_expenses_category_tree,
+            revenue_category_tree=sample_revenue_category_tree,
+            rule_set_wrappers=[create_rule_set_wrapper_with_rule(groceries, ["Supermarket"])],
+        )
+        traverser.set_current_transaction(sample_transaction)
+
+        assert traverser.lowercased_fields == {"communications": "payment at supermarket"}
+        assert traverser.traverse() == groceries
+
+    def test_traverse_many_returns_category_per_transaction(
+        self,
+        sample_expenses_category_tree: CategoryTree,
+        sample_revenue_category_tree: CategoryTree,
+        sample_transaction: Transaction,
+    ):
+        """Test that traverse_many categorizes each transaction in order."""
+        groceries = sample_expenses_category_tree.root.children[0]
+        unmatched = sample_transaction.model_copy(update={"communications": "Cinema tickets"})
+
+        traverser = RuleSetWrappersPostOrderTraverser(
+            expenses_category_tree=sample_expenses_category_tree,
+            revenue_category_tree=sample_revenue_category_tree,
+            rule_set_wrappers=[create_rule_set_wrapper_with_rule(groceries, ["Groceries"])],
+        )
+
+        assert traverser.traverse_many([sample_transaction, unmatched]) == [groceries, None]
+        assert sample_transaction.category == groceries
+
 
 class TestRuleSetWrapperGetRuleSet:
     """Tests for RuleSetWrapper.get_rule_set() method."""
@@ -361,7 +456,7 @@ class TestRuleSetWrapperGetRuleSet:
             clazz="RuleSet",
             type=TransactionTypeEnum.EXPENSES,
         )
-        wrapper = RuleSetWrapper(id=1, rule_set_json=json.dumps(rule_set.model_dump()))
+        wrapper = RuleSetWrapper(id=1, rule_set_json=rule_set.model_dump_json())
 
         result = wrapper.get_rule_set()
 
@@ -388,3 +483,21 @@ class TestRuleSetWrapperGetRuleSet:
         result = wrapper.get_rule_set()
         assert result is not None
         assert result.condition == "AND"
+
+    def test_get_rule_set_reuses_parsed_rule_set(self):
+        """Test that the parsed rule set is cached per JSON string and refreshed when the JSON changes."""
+        rule_set = RuleSet(
+            condition="OR",
+            rules=[],
+            is_child=False,
+            clazz="RuleSet",
+            type=TransactionTypeEnum.EXPENSES,
+        )
+        wrapper = RuleSetWrapper(id=1, rule_set_json=rule_set.model_dump_json())
+        other_wrapper = RuleSetWrapper(id=2, rule_set_json=rule_set.model_dump_json())
+
+        assert wrapper.get_rule_set() is wrapper.get_rule_set()
+        assert other_wrapper.get_rule_set() is wrapper.get_rule_set()
+
+        wrapper.set_rule_set(rule_set.model_copy(update={"condition": "AND"}))
+        assert wrapper.get_rule_set().condition == "AND"
@@ -1,14 +1,20 @@
 """Tests for RuleService.get_or_create_all_rule_set_wrappers."""
 
+from contextlib import contextmanager
+from typing import Iterator
+
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from common.enums import TransactionTypeEnum
 from models import Category, RuleSetWrapper, User
 from models.associations import UserRuleSetLink
 from services.rule_service import RuleService
+from tests.conftest import shared_connection_fixtures
+
+pytestmark = pytest.mark.xdist_group("rule_service_get_or_create_all")
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -21,7 +27,6 @@ async def user(async_session: AsyncSession) -> User:
     user = User(email="ruletest@example.com", password_hash="hashed_password123")
     async_session.add(user)
     await async_session.commit()
-    await async_session.refresh(user)
     return user
 
 
@@ -31,68 +36,69 @@ async def second_user(async_session: AsyncSession) -> User:
     user = User(email="ruletest2@example.com", password_hash="hashed_password456")
     async_session.add(user)
     await async_session.commit()
-    await async_session.refresh(user)
     return user
 
 
-@pytest_asyncio.fixture
-async def expense_categories(async_session: AsyncSession) -> list[Category]:
-    """Create expense categories."""
-    root = Category(
-        name="Expenses",
-        qualified_name="Expenses",
-        is_root=True,
-        type=TransactionTypeEnum.EXPENSES,
-    )
-    async_session.add(root)
-    await async_session.flush()
-
-    groceries = Category(
-        name="Groceries",
-        qualified_name="Expenses > Groceries",
-        is_root=False,
-        type=TransactionTypeEnum.EXPENSES,
-        parent_id=root.id,
+async def _insert_category_tree(
+    async_session: AsyncSession,
+    root_name: str,
+    child_names: list[str],
+    transaction_type: TransactionTypeEnum,
+) -> list[Category]:
+    """Insert a root category and its children with two INSERT ... RETURNING statements.
+
+    RETURNING populates the primary keys directly, so no flush/refresh round-trips are needed.
+    """
+    root = await async_session.scalar(
+        insert(Category).returning(Category),
+        [{"name": root_name, "qualified_name": root_name, "is_root": True, "type": transaction_type}],
     )
-    transport = Category(
-        name="Transport",
-        qualified_name="Expenses > Transport",
-        is_root=False,
-        type=TransactionTypeEnum.EXPENSES,
-        parent_id=root.id,
+    children = await async_session.scalars(
+        insert(Category).returning(Category),
+        [
+            {
+                "name": name,
+                "qualified_name": f"{root_name} > {name}",
+                "is_root": False,
+                "type": transaction_type,
+                "parent_id": root.id,
+            }
+            for name in child_names
+        ],
     )
-    async_session.add_all([groceries, transport])
+    categories = [root, *children.all()]
     await async_session.commit()
-    await async_session.refresh(root)
-    await async_session.refresh(groceries)
-    await async_session.refresh(transport)
-    return [root, groceries, transport]
+    return categories
 
 
-@pytest_asyncio.fixture
-async def revenue_categories(async_session: AsyncSession) -> list[Category]:
-    """Create revenue categories."""
-    root = Category(
-        name="Revenue",
-        qualified_name="Revenue",
-        is_root=True,
-        type=TransactionTypeEnum.REVENUE,
-    )
-    async_session.add(root)
-    await async_session.flush()
-
-    salary = Category(
-        name="Salary",
-        qualified_name="Revenue > Salary",
-        is_root=False,
-        type=TransactionTypeEnum.REVENUE,
-        parent_id=root.id,
-    )
-    async_session.add(salary)
-    await async_session.commit()
-    await async_session.refresh(root)
-    await async_session.refresh(salary)
-    return [root, salary]
+# Seed data is shared per test class; each test runs in a SAVEPOINT on the class connection
+shared_connection, async_connection, shared_session_maker = shared_connection_fixtures("class")
+
+
+@pytest_asyncio.fixture(scope="class")
+async def category_trees(shared_session_maker: async_sessionmaker) -> dict[TransactionTypeEnum, list[Category]]:
+    """Create the expense and revenue categories once per test class."""
+    async with shared_session_maker() as session:
+        return {
+            TransactionTypeEnum.EXPENSES: await _insert_category_tree(
+                session, "Expenses", ["Groceries", "Transport"], TransactionTypeEnum.EXPENSES
+            ),
+            TransactionTypeEnum.REVENUE: await _insert_category_tree(
+                session, "Revenue", ["Salary"], TransactionTypeEnum.REVENUE
+            ),
+        }
+
+
+@pytest.fixture(scope="class")
+def expense_categories(category_trees: dict[TransactionTypeEnum, list[Category]]) -> list[Category]:
+    """Expense categories shared by the test class."""
+    return category_trees[TransactionTypeEnum.EXPENSES]
+
+
+@pytest.fixture(scope="class")
+def revenue_categories(category_trees: dict[TransactionTypeEnum, list[Category]]) -> list[Category]:
+    """Revenue categories shared by the test class."""
+    return category_trees[TransactionTypeEnum.REVENUE]
 
 
 @pytest.fixture
@@ -100,6 +106,22 @@ def service() -> RuleService:
     return RuleService()
 
 
+@contextmanager
+def _count_statements(async_engine: AsyncEngine) -> Iterator[list[str]]:
+    """Collect the SQL statements executed on the engine inside the block, ignoring test SAVEPOINT bookkeeping."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -122,9 +144,9 @@ class TestGetOrCreateAllRuleSetWrappers:
 
         total_categories = len(expense_categories) + len(revenue_categories)
 
-        # Flatten all wrappers across types
-        all_wrappers = {qn: w for type_dict in result.values() for qn, w in type_dict.items()}
-        assert len(all_wrappers) == total_categories
+        # Count wrappers across types without materializing a flattened dict
+        total_wrappers = sum(len(type_dict) for type_dict in result.values())
+        assert total_wrappers == total_categories
 
     @pytest.mark.asyncio
     async def test_returns_correct_type_grouping(
@@ -230,7 +252,6 @@ class TestGetOrCreateAllRuleSetWrappers:
         )
         async_session.add(existing)
         await async_session.commit()
-        await async_session.refresh(existing)
 
         result = await service.get_or_create_all_rule_set_wrappers(user, async_session)
 
@@ -260,6 +281,7 @@ class TestGetOrCreateAllRuleSetWrappers:
         user: User,
         second_user: User,
         expense_categories: list[Category],
+        revenue_categories: list[Category],
     ):
         """A second user calling the method gets linked to the same wrappers."""
         result1 = await service.get_or_create_all_rule_set_wrappers(user, async_session)
@@ -273,32 +295,57 @@ class TestGetOrCreateAllRuleSetWrappers:
         # Both users have links
         for uid in (user.id, second_user.id):
             links_result = await async_session.execute(select(UserRuleSetLink).where(UserRuleSetLink.user_id == uid))
-            assert len(links_result.scalars().all()) == len(expense_categories)
+            assert len(links_result.scalars().all()) == len(expense_categories) + len(revenue_categories)
 
     @pytest.mark.asyncio
-    async def test_no_categories_returns_empty(
+    async def test_wrapper_category_id_matches(
         self,
         async_session: AsyncSession,
         service: RuleService,
         user: User,
+        expense_categories: list[Category],
     ):
-        """When no categories exist, the result is empty."""
+        """Each returned wrapper's category_id matches the category it maps to."""
         result = await service.get_or_create_all_rule_set_wrappers(user, async_session)
-        # defaultdict so access doesn't fail, but all should be empty
-        total = sum(len(d) for d in result.values())
-        assert total == 0
+
+        # Only scalar columns are read, so no relationship load is triggered here
+        for cat in expense_categories:
+            wrapper = result[TransactionTypeEnum.EXPENSES][cat.qualified_name]
+            assert wrapper.category_id == cat.id
 
     @pytest.mark.asyncio
-    async def test_wrapper_category_id_matches(
+    async def test_existing_wrappers_are_loaded_in_one_query(
         self,
+        async_engine: AsyncEngine,
         async_session: AsyncSession,
         service: RuleService,
         user: User,
         expense_categories: list[Category],
+        revenue_categories: list[Category],
     ):
-        """Each returned wrapper's category_id matches the category it maps to."""
-        result = await service.get_or_create_all_rule_set_wrappers(user, async_session)
+        """Once everything exists, wrappers and links come from a single SELECT without per-category loads."""
+        await service.get_or_create_all_rule_set_wrappers(user, async_session)
 
-        for cat in expense_categories:
-            wrapper = result[TransactionTypeEnum.EXPENSES][cat.qualified_name]
-            assert wrapper.category_id == cat.id
+        with _count_statements(async_engine) as statements:
+            result = await service.get_or_create_all_rule_set_wrappers(user, async_session)
+            category_ids = {wrapper.category_id for wrapper in result[TransactionTypeEnum.EXPENSES].values()}
+
+        assert category_ids == {cat.id for cat in expense_categories}
+        assert len(statements) == 1
+
+
+class TestGetOrCreateAllRuleSetWrappersWithoutCategories:
+    """Tests for RuleService.get_or_create_all_rule_set_wrappers on an empty category table."""
+
+    @pytest.mark.asyncio
+    async def test_no_categories_returns_empty(
+        self,
+        async_session: AsyncSession,
+        service: RuleService,
+        user: User,
+    ):
+        """When no categories exist, the result is empty."""
+        result = await service.get_or_create_all_rule_set_wrappers(user, async_session)
+        # defaultdict so access doesn't fail, but all should be empty
+        total = sum(len(d) for d in result.values())
+        assert total == 0
@@ -3,61 +3,68 @@
 Port of BudgetAssistant-backend/pybackend.tests.test_services.TransactionsServiceTests
 """
 
+import itertools
 from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from common.enums import TransactionTypeEnum
 from models import BankAccount, Category, Counterparty, Transaction, User
 from models.associations import UserBankAccountLink
 from schemas import TransactionQuery, TransactionUpdate
 from services.transaction_service import TransactionService
+from tests.conftest import shared_connection_fixtures
 
+# Fixed booking date and upload timestamp for transactions whose dates are irrelevant to the test
+DEFAULT_BOOKING_DATE = date(2025, 1, 1)
+DEFAULT_UPLOAD_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
-@pytest_asyncio.fixture
-async def user(async_session: AsyncSession) -> User:
+pytestmark = pytest.mark.xdist_group("transaction_service")
+shared_connection, async_connection, shared_session_maker = shared_connection_fixtures("module")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def user(shared_session_maker: async_sessionmaker) -> User:
     """Create a test user."""
     user = User(
         email="testuser@example.com",
         password_hash="hashed_password123",
     )
-    async_session.add(user)
-    await async_session.commit()
-    await async_session.refresh(user)
+    async with shared_session_maker() as session:
+        session.add(user)
+        await session.commit()
     return user
 
 
-@pytest_asyncio.fixture
-async def bank_account(async_session: AsyncSession) -> BankAccount:
+@pytest_asyncio.fixture(scope="module")
+async def bank_account(shared_session_maker: async_sessionmaker) -> BankAccount:
     """Create a test bank account."""
     bank_account = BankAccount(account_number="123456789")
-    async_session.add(bank_account)
-    await async_session.commit()
-    await async_session.refresh(bank_account)
+    async with shared_session_maker() as session:
+        session.add(bank_account)
+        await session.commit()
     return bank_account
 
 
-@pytest_asyncio.fixture
-async def bank_account_with_user(async_session: AsyncSession, user: User) -> BankAccount:
+@pytest_asyncio.fixture(scope="module")
+async def bank_account_with_user(shared_session_maker: async_sessionmaker, user: User) -> BankAccount:
     """Create a test bank account associated with user."""
     bank_account = BankAccount(account_number="test_account")
-    async_session.add(bank_account)
-    await async_session.flush()
-
-    link = UserBankAccountLink(
-        user_id=user.id,
-        bank_account_number=bank_account.account_number,
-    )
-    async_session.add(link)
-    await async_session.commit()
-    await async_session.refresh(bank_account)
+    async with shared_session_maker() as session:
+        session.add_all(
+            [bank_account, UserBankAccountLink(user_id=user.id, bank_account_number=bank_account.account_number)]
+        )
+        await session.commit()
     return bank_account
 
 
-@pytest_asyncio.fixture
-async def category(async_session: AsyncSession) -> Category:
+@pytest_asyncio.fixture(scope="module")
+async def category(shared_session_maker: async_sessionmaker) -> Category:
     """Create a test category."""
     category = Category(
         name="Test Category",
@@ -65,33 +72,48 @@ async def category(async_session: AsyncSession) -> Category:
         type=TransactionTypeEnum.EXPENSES,
         is_root=True,
     )
-    async_session.add(category)
-    await async_session.commit()
-    await async_session.refresh(category)
+    async with shared_session_maker() as session:
+        session.add(category)
+        await session.commit()
     return category
 
 
-@pytest_asyncio.fixture
-async def counterparty(async_session: AsyncSession) -> Counterparty:
+@pytest_asyncio.fixture(scope="module")
+async def counterparty(shared_session_maker: async_sessionmaker) -> Counterparty:
     """Create a test counterparty."""
     counterparty = Counterparty(
         name="Test Counterparty",
         account_number="987654321",
     )
-    async_session.add(counterparty)
-    await async_session.commit()
-    await async_session.refresh(counterparty)
+    async with shared_session_maker() as session:
+        session.add(counterparty)
+        await session.commit()
     return counterparty
 
 
-@pytest_asyncio.fixture
+@pytest.fixture
+def counterparty_factory() -> Callable[..., Counterparty]:
+    """Build unsaved counterparties with unique names and account numbers, so tests can add them in one batch."""
+    counter = itertools.count()
+
+    def make(name: str | None = None, account_number: str | None = None) -> Counterparty:
+        n = next(counter)
+        return Counterparty(name=name or f"Counterparty {n}", account_number=account_number or f"CP{n:09d}")
+
+    return make
+
+
+@pytest_asyncio.fixture(scope="module")
 async def service() -> TransactionService:
     """Get TransactionService instance."""
     return TransactionService()
 
 
-async def create_transaction(
-    async_session: AsyncSession,
+# Source of transaction numbers for seeded rows that do not name one; numbers never repeat within a run
+_auto_transaction_numbers = itertools.count()
+
+
+def transaction_row(
     bank_account: BankAccount,
     counterparty: Counterparty,
     amount: float = -10.0,
@@ -100,39 +122,158 @@ async def create_transaction(
     manually_assigned_category: bool = False,
     upload_timestamp: datetime | None = None,
     transaction_number: str | None = None,
-) -> Transaction:
-    """Helper to create a test transaction."""
-    if transaction_number is None:
-        # Generate unique transaction number
-        import uuid
-
-        transaction_number = str(uuid.uuid4())
-
+    transaction: str = "Test transaction",
+    communications: str = "Test communication",
+) -> dict:
+    """Helper to build the column values of a test transaction, for Core bulk inserts of seed data."""
+    # Generate a unique, deterministic transaction number
+    transaction_number = transaction_number or f"TXN_AUTO_{next(_auto_transaction_numbers):05d}"
     transaction_id = Transaction.create_transaction_id(transaction_number, bank_account.account_number)
 
-    transaction = Transaction(
+    return dict(
         transaction_id=transaction_id,
         bank_account_id=bank_account.account_number,
-        booking_date=date.today(),
+        booking_date=DEFAULT_BOOKING_DATE,
         statement_number="001",
         counterparty_id=counterparty.name,
         transaction_number=transaction_number,
-        transaction="Test transaction",
-        currency_date=date.today(),
+        transaction=transaction,
+        currency_date=DEFAULT_BOOKING_DATE,
         amount=amount,
         currency="EUR",
         country_code="BE",
-        communications="Test communication",
+        communications=communications,
         category_id=category_id,
         manually_assigned_category=manually_assigned_category,
         is_manually_reviewed=is_manually_reviewed,
-        upload_timestamp=upload_timestamp or datetime.now(timezone.utc),
+        upload_timestamp=upload_timestamp or DEFAULT_UPLOAD_TS,
     )
+
+
+def build_transaction(bank_account: BankAccount, counterparty: Counterparty, **kwargs) -> Transaction:
+    """Helper to build an unsaved test transaction, so several can be added and flushed at once."""
+    return Transaction(**transaction_row(bank_account, counterparty, **kwargs))
+
+
+async def create_transaction(
+    async_session: AsyncSession,
+    bank_account: BankAccount,
+    counterparty: Counterparty,
+    **kwargs,
+) -> Transaction:
+    """Helper to create and flush a single test transaction."""
+    transaction = build_transaction(bank_account, counterparty, **kwargs)
     async_session.add(transaction)
     await async_session.flush()
     return transaction
 
 
+async def create_transactions(
+    async_session: AsyncSession,
+    bank_account: BankAccount,
+    counterparty: Counterparty,
+    specs: List[dict],
+) -> List[Transaction]:
+    """Helper to create several test transactions, one per spec of build_transaction kwargs, with a single flush."""
+    transactions = [build_transaction(bank_account, counterparty, **spec) for spec in specs]
+    async_session.add_all(transactions)
+    await async_session.flush()
+    return transactions
+
+
+@pytest_asyncio.fixture
+async def account_setup(async_session: AsyncSession, user: User, counterparty: Counterparty) -> SimpleNamespace:
+    """Create a bank account linked to the user, with a single flush, next to the shared counterparty."""
+    bank_account = BankAccount(account_number="test_account")
+    async_session.add_all(
+        [bank_account, UserBankAccountLink(user_id=user.id, bank_account_number=bank_account.account_number)]
+    )
+    await async_session.flush()
+    return SimpleNamespace(bank_account=bank_account, counterparty=counterparty)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def filter_dataset(shared_session_maker: async_sessionmaker, counterparty: Counterparty) -> User:
+    """Seed, once per module, a user whose account holds transactions for the filter and sort tests.
+
+    Amounts are all distinct, so sorting by amount gives a deterministic order.
+    """
+    user = User(email="filters@example.com", password_hash="hashed_password123")
+    bank_account = BankAccount(account_number="filter_account")
+    counterparty_abc = Counterparty(name="Supermarket ABC", account_number="111111111")
+    counterparty_xyz = Counterparty(name="Gas Station XYZ", account_number="222222222")
+    async with shared_session_maker() as session:
+        session.add_all([user, bank_account, counterparty_abc, counterparty_xyz])
+        await session.flush()
+        session.add(UserBankAccountLink(user_id=user.id, bank_account_number=bank_account.account_number))
+        session.add_all(
+            [
+                build_transaction(bank_account, counterparty, amount=-10.0, transaction_number="TXN_10"),
+                build_transaction(bank_account, counterparty, amount=-50.0, transaction_number="TXN_50"),
+                build_transaction(bank_account, counterparty, amount=-100.0, transaction_number="TXN_100"),
+                build_transaction(bank_account, counterparty, amount=100.0, transaction_number="REVENUE_1"),
+                build_transaction(bank_account, counterparty_abc, amount=-20.0, transaction_number="TXN_ABC"),
+                build_transaction(bank_account, counterparty_xyz, amount=-30.0, transaction_number="TXN_XYZ"),
+            ]
+        )
+        await session.commit()
+    return user
+
+
+@pytest_asyncio.fixture(scope="module")
+async def pagination_dataset(
+    shared_session_maker: async_sessionmaker, counterparty: Counterparty
+) -> Tuple[User, List[str]]:
+    """Seed, once per module, a user whose account holds 99 transactions for the pagination tests.
+
+    Returns the user and the transaction ids in ascending order.
+    """
+    user = User(email="pagination@example.com", password_hash="hashed_password123")
+    bank_account = BankAccount(account_number="pagination_account")
+    rows = [
+        transaction_row(bank_account, counterparty, amount=-10.0, transaction_number=f"TXN{i:03d}") for i in range(99)
+    ]
+    async with shared_session_maker() as session:
+        session.add_all([user, bank_account])
+        await session.flush()
+        session.add(UserBankAccountLink(user_id=user.id, bank_account_number=bank_account.account_number))
+        await session.flush()
+        # Seed rows through a Core bulk insert, skipping ORM instance construction and identity-map bookkeeping
+        await session.execute(insert(Transaction), rows)
+        await session.commit()
+    return user, sorted(row["transaction_id"] for row in rows)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def review_dataset(shared_session_maker: async_sessionmaker, counterparty: Counterparty) -> BankAccount:
+    """Seed, once per module, an account holding categorized and uncategorized transactions for the review tests.
+
+    Only the UNCAT_* transactions have no category: three expenses and one revenue.
+    """
+    bank_account = BankAccount(account_number="review_account")
+    rows = [
+        transaction_row(bank_account, counterparty, amount=-10.0, transaction_number="UNCAT_EXP_1"),
+        transaction_row(bank_account, counterparty, amount=-20.0, transaction_number="UNCAT_EXP_2"),
+        transaction_row(bank_account, counterparty, amount=-30.0, transaction_number="UNCAT_EXP_3"),
+        transaction_row(bank_account, counterparty, amount=100.0, transaction_number="UNCAT_REV"),
+        transaction_row(
+            bank_account,
+            counterparty,
+            amount=-50.0,
+            is_manually_reviewed=True,
+            category_id=1,
+            transaction_number="CAT_EXP",
+        ),
+        transaction_row(bank_account, counterparty, amount=10.0, category_id=10, transaction_number="CAT_REV"),
+    ]
+    async with shared_session_maker() as session:
+        session.add(bank_account)
+        await session.flush()
+        await session.execute(insert(Transaction), rows)
+        await session.commit()
+    return bank_account
+
+
 class TestTransactionService:
     """Tests for TransactionService operations."""
 
@@ -140,37 +281,12 @@ class TestTransactionService:
     async def test_page_uncategorized_transactions_returns_transactions(
         self,
         async_session: AsyncSession,
+        review_dataset: BankAccount,
         service: TransactionService,
     ):
         """Test that page_uncategorized_transactions returns transactions needing review."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transactions - 3 expenses (negative), 1 revenue (positive)
-        # All with is_manually_reviewed=False
-        transaction1 = await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        transaction2 = await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        transaction3 = await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        transaction4 = await create_transaction(
-            async_session, bank_account, counterparty, amount=10.0, is_manually_reviewed=False, category_id=1
-        )
-        await async_session.commit()
-
         transactions, total = await service.page_uncategorized_transactions(
-            bank_account=bank_account.account_number,
+            bank_account=review_dataset.account_number,
             page=0,
             size=10,
             sort_order="asc",
@@ -180,11 +296,7 @@ class TestTransactionService:
         )
 
         assert total == 3
-        transaction_ids = [t.transaction_id for t in transactions]
-        assert transaction1.transaction_id in transaction_ids
-        assert transaction2.transaction_id in transaction_ids
-        assert transaction3.transaction_id in transaction_ids
-        assert transaction4.transaction_id not in transaction_ids
+        assert [t.transaction_number for t in transactions] == ["UNCAT_EXP_3", "UNCAT_EXP_2", "UNCAT_EXP_1"]
 
     @pytest.mark.asyncio
     async def test_page_uncategorized_transactions_returns_empty_if_no_transactions(
@@ -211,40 +323,16 @@ class TestTransactionService:
     async def test_count_uncategorized_transactions_returns_count(
         self,
         async_session: AsyncSession,
+        review_dataset: BankAccount,
         service: TransactionService,
     ):
-        """Test that count_uncategorized_transactions returns correct count."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create 4 transactions that need manual review
-        await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        await create_transaction(
-            async_session, bank_account, counterparty, amount=-10.0, is_manually_reviewed=False, category_id=None
-        )
-        await create_transaction(
-            async_session, bank_account, counterparty, amount=10.0, is_manually_reviewed=False, category_id=10
-        )
-        await async_session.commit()
-
+        """Test that count_uncategorized_transactions counts uncategorized expenses and revenue."""
         count = await service.count_uncategorized_transactions(
-            bank_account=bank_account.account_number,
+            bank_account=review_dataset.account_number,
             session=async_session,
         )
 
-        assert count == 3
+        assert count == 4
 
     @pytest.mark.asyncio
     async def test_count_uncategorized_transactions_returns_zero_if_no_transactions(
@@ -265,25 +353,16 @@ class TestTransactionService:
     async def test_save_transaction_updates_existing_transaction(
         self,
         async_session: AsyncSession,
+        bank_account: BankAccount,
+        counterparty: Counterparty,
         service: TransactionService,
         category: Category,
     ):
         """Test that save_transaction updates an existing transaction."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
         # Create transaction with manually_assigned_category=False
         transaction = await create_transaction(
             async_session, bank_account, counterparty, manually_assigned_category=False
         )
-        await async_session.commit()
 
         # Update transaction
         update_data = TransactionUpdate(
@@ -317,128 +396,75 @@ class TestTransactionService:
 
         assert "Transaction with id 'nonexistent' does not exist" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_page_transactions_pagination(
+    @pytest.mark.parametrize("page_num", range(10))
+    async def test_page_transactions_pagination_page(
         self,
         async_session: AsyncSession,
-        user: User,
+        pagination_dataset: Tuple[User, List[str]],
         service: TransactionService,
+        page_num: int,
     ):
-        """Test that page_transactions handles pagination correctly."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
+        """Test that page_transactions returns the expected slice for each page of 99 transactions."""
+        user, transaction_ids = pagination_dataset
 
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
+        response_transactions, total = await service.page_transactions(
+            query=None,
+            page=page_num,
+            size=10,
+            sort_order="asc",
+            sort_property="transaction_id",
+            user=user,
+            session=async_session,
         )
-        async_session.add(link)
-        await async_session.flush()
 
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
+        # Verify total_elements is always 99
+        assert total == 99
 
-        # Create 99 transactions
-        transactions = []
-        for i in range(99):
-            transaction = await create_transaction(
-                async_session,
-                bank_account,
-                counterparty,
-                amount=-10.0,
-                transaction_number=f"TXN{i:03d}",
-            )
-            transactions.append(transaction)
-        await async_session.commit()
-
-        # Sort transactions by transaction_id for comparison
-        transactions.sort(key=lambda t: t.transaction_id)
-
-        # Check all pages from 0 to 9 (0-indexed pages)
-        for page_num in range(10):
-            response_transactions, total = await service.page_transactions(
-                query=None,
-                page=page_num,
-                size=10,
-                sort_order="asc",
-                sort_property="transaction_id",
-                user=user,
-                session=async_session,
-            )
+        # 10 transactions for pages 0-8, 9 for page 9
+        expected_size = 9 if page_num == 9 else 10
+        assert len(response_transactions) == expected_size
 
-            # Verify total_elements is always 99
-            assert total == 99
-
-            # Calculate expected content size (10 for pages 0-8, 9 for page 9)
-            expected_size = 9 if page_num == 9 else 10
-            assert len(response_transactions) == expected_size
-
-            # Calculate expected transactions for this page
-            start_idx = page_num * 10
-            end_idx = min(start_idx + 10, 99)
-            expected_transaction_ids = [t.transaction_id for t in transactions[start_idx:end_idx]]
-
-            # Verify content matches expected transactions
-            actual_transaction_ids = [t.transaction_id for t in response_transactions]
-            assert actual_transaction_ids == expected_transaction_ids
+        start_idx = page_num * 10
+        expected_transaction_ids = transaction_ids[start_idx : start_idx + 10]
+        assert [t.transaction_id for t in response_transactions] == expected_transaction_ids
 
     @pytest.mark.asyncio
     async def test_page_transactions_upload_timestamp_filter(
         self,
         async_session: AsyncSession,
         user: User,
+        account_setup: SimpleNamespace,
         service: TransactionService,
     ):
         """Test that page_transactions filters by upload_timestamp correctly."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
+        bank_account, counterparty = account_setup.bank_account, account_setup.counterparty
 
         # Create 10 transactions with first upload timestamp
         upload_timestamp_1 = datetime(2025, 5, 1, 15, 53, 37, 0, tzinfo=timezone.utc)
-        transactions_1 = []
-        for i in range(10):
-            transaction = await create_transaction(
-                async_session,
+        rows_1 = [
+            transaction_row(
                 bank_account,
                 counterparty,
                 amount=-10.0,
                 upload_timestamp=upload_timestamp_1,
                 transaction_number=f"TXN_TS1_{i:03d}",
             )
-            transactions_1.append(transaction)
+            for i in range(10)
+        ]
 
         # Create 10 transactions with second upload timestamp
         upload_timestamp_2 = datetime(2025, 5, 2, 15, 53, 37, 0, tzinfo=timezone.utc)
-        transactions_2 = []
-        for i in range(10):
-            transaction = await create_transaction(
-                async_session,
+        rows_2 = [
+            transaction_row(
                 bank_account,
                 counterparty,
                 amount=-10.0,
                 upload_timestamp=upload_timestamp_2,
                 transaction_number=f"TXN_TS2_{i:03d}",
             )
-            transactions_2.append(transaction)
-        await async_session.commit()
+            for i in range(10)
+        ]
+        await async_session.execute(insert(Transaction), rows_1 + rows_2)
 
         # Query transactions with first upload timestamp
         query = TransactionQuery(
@@ -459,35 +485,26 @@ class TestTransactionService:
         # Verify total_elements is 10
         assert total == 10
 
-        # Verify all transactions have the first upload timestamp
+        # Verify all transactions have the first upload timestamp; the column stores it without tzinfo
         for transaction in response_transactions:
-            assert transaction.upload_timestamp == upload_timestamp_1
+            assert transaction.upload_timestamp == upload_timestamp_1.replace(tzinfo=None)
 
-        # Verify content matches transactions_1
+        # Verify content matches rows_1
         response_ids = {t.transaction_id for t in response_transactions}
-        expected_ids = {t.transaction_id for t in transactions_1}
+        expected_ids = {row["transaction_id"] for row in rows_1}
         assert response_ids == expected_ids
 
     @pytest.mark.asyncio
     async def test_get_transaction_returns_transaction(
         self,
         async_session: AsyncSession,
+        bank_account: BankAccount,
+        counterparty: Counterparty,
         service: TransactionService,
     ):
         """Test that get_transaction returns a transaction by ID."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
         # Create transaction
         transaction = await create_transaction(async_session, bank_account, counterparty)
-        await async_session.commit()
 
         # Retrieve transaction
         retrieved = await service.get_transaction(
@@ -525,22 +542,21 @@ class TestTransactionService:
 
         transaction_in = TransactionCreate(
             bank_account_id=bank_account.account_number,
-            booking_date=date.today(),
+            booking_date=DEFAULT_BOOKING_DATE,
             statement_number="001",
             counterparty_id=counterparty.name,
             transaction_number="NEW_TXN_001",
             transaction="Test transaction",
-            currency_date=date.today(),
+            currency_date=DEFAULT_BOOKING_DATE,
             amount=-50.0,
             currency="EUR",
             country_code="BE",
             communications="Test communication",
         )
 
-        upload_timestamp = datetime.now(timezone.utc)
         transaction, created = await service.get_or_create_transaction(
             transaction_in=transaction_in,
-            upload_timestamp=upload_timestamp,
+            upload_timestamp=DEFAULT_UPLOAD_TS,
             session=async_session,
         )
 
@@ -563,27 +579,25 @@ class TestTransactionService:
         existing = await create_transaction(
             async_session, bank_account, counterparty, transaction_number="EXISTING_TXN"
         )
-        await async_session.commit()
 
         # Try to create with same transaction_number
         transaction_in = TransactionCreate(
             bank_account_id=bank_account.account_number,
-            booking_date=date.today(),
+            booking_date=DEFAULT_BOOKING_DATE,
             statement_number="001",
             counterparty_id=counterparty.name,
             transaction_number="EXISTING_TXN",
             transaction="Test transaction",
-            currency_date=date.today(),
+            currency_date=DEFAULT_BOOKING_DATE,
             amount=-100.0,  # Different amount
             currency="EUR",
             country_code="BE",
             communications="Test communication",
         )
 
-        upload_timestamp = datetime.now(timezone.utc)
         transaction, created = await service.get_or_create_transaction(
             transaction_in=transaction_in,
-            upload_timestamp=upload_timestamp,
+            upload_timestamp=DEFAULT_UPLOAD_TS,
             session=async_session,
         )
 
@@ -591,110 +605,55 @@ class TestTransactionService:
         assert transaction.transaction_id == existing.transaction_id
 
     @pytest.mark.asyncio
-    async def test_page_transactions_filters_by_transaction_type_expenses(
+    @pytest.mark.parametrize(
+        ("query", "sort_order", "expected_transaction_numbers"),
+        [
+            (
+                TransactionQuery(transaction_type=TransactionTypeEnum.EXPENSES),
+                "asc",
+                ["TXN_100", "TXN_50", "TXN_XYZ", "TXN_ABC", "TXN_10"],
+            ),
+            (TransactionQuery(transaction_type=TransactionTypeEnum.REVENUE), "asc", ["REVENUE_1"]),
+            (TransactionQuery(min_amount=-60.0, max_amount=-40.0), "asc", ["TXN_50"]),
+            (TransactionQuery(counterparty_name="ABC"), "asc", ["TXN_ABC"]),
+            (None, "asc", ["TXN_100", "TXN_50", "TXN_XYZ", "TXN_ABC", "TXN_10", "REVENUE_1"]),
+            (None, "desc", ["REVENUE_1", "TXN_10", "TXN_ABC", "TXN_XYZ", "TXN_50", "TXN_100"]),
+        ],
+        ids=["expenses", "revenue", "amount_range", "counterparty_name", "sorts_ascending", "sorts_descending"],
+    )
+    async def test_page_transactions_filters_and_sorts(
         self,
         async_session: AsyncSession,
-        user: User,
+        filter_dataset: User,
         service: TransactionService,
+        query: TransactionQuery | None,
+        sort_order: str,
+        expected_transaction_numbers: list[str],
     ):
-        """Test that page_transactions filters by transaction type (expenses)."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create expense transaction
-        expense_txn = await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            transaction_number="EXPENSE_1",
-        )
-        # Create revenue transaction
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=100.0,
-            transaction_number="REVENUE_1",
-        )
-        await async_session.commit()
-
-        # Query expenses only
-        query = TransactionQuery(transaction_type=TransactionTypeEnum.EXPENSES)
+        """Test that page_transactions applies query filters and sort order to the shared dataset."""
         transactions, total = await service.page_transactions(
             query=query,
             page=0,
             size=10,
-            sort_order="asc",
-            sort_property="transaction_id",
-            user=user,
+            sort_order=sort_order,
+            sort_property="amount",
+            user=filter_dataset,
             session=async_session,
         )
 
-        assert total == 1
-        assert transactions[0].transaction_id == expense_txn.transaction_id
+        assert total == len(expected_transaction_numbers)
+        assert [t.transaction_number for t in transactions] == expected_transaction_numbers
 
     @pytest.mark.asyncio
-    async def test_page_transactions_filters_by_transaction_type_revenue(
+    async def test_page_transactions_returns_empty_for_user_without_accounts(
         self,
         async_session: AsyncSession,
         user: User,
         service: TransactionService,
     ):
-        """Test that page_transactions filters by transaction type (revenue)."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create expense transaction
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            transaction_number="EXPENSE_1",
-        )
-        # Create revenue transaction
-        revenue_txn = await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=100.0,
-            transaction_number="REVENUE_1",
-        )
-        await async_session.commit()
-
-        # Query revenue only
-        query = TransactionQuery(transaction_type=TransactionTypeEnum.REVENUE)
+        """Test that page_transactions returns empty for user without bank accounts."""
         transactions, total = await service.page_transactions(
-            query=query,
+            query=None,
             page=0,
             size=10,
             sort_order="asc",
@@ -703,261 +662,41 @@ class TestTransactionService:
             session=async_session,
         )
 
-        assert total == 1
-        assert transactions[0].transaction_id == revenue_txn.transaction_id
+        assert transactions == []
+        assert total == 0
 
-    @pytest.mark.asyncio
-    async def test_page_transactions_filters_by_amount_range(
+    async def test_count_transactions_returns_zero_for_user_without_accounts(
         self,
         async_session: AsyncSession,
         user: User,
         service: TransactionService,
     ):
-        """Test that page_transactions filters by min and max amount."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transactions with different amounts
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-10.0,
-            transaction_number="TXN_10",
-        )
-        txn2 = await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            transaction_number="TXN_50",
-        )
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-100.0,
-            transaction_number="TXN_100",
-        )
-        await async_session.commit()
-
-        # Query with amount range
-        query = TransactionQuery(min_amount=-60.0, max_amount=-40.0)
-        transactions, total = await service.page_transactions(
-            query=query,
-            page=0,
-            size=10,
-            sort_order="asc",
-            sort_property="transaction_id",
-            user=user,
-            session=async_session,
-        )
+        """Test that count_transactions returns 0 for a user without bank accounts."""
+        assert await service.count_transactions(query=None, user=user, session=async_session) == 0
 
-        assert total == 1
-        assert transactions[0].transaction_id == txn2.transaction_id
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_filters_by_counterparty_name(
+    async def test_count_transactions_applies_query(
         self,
         async_session: AsyncSession,
-        user: User,
+        filter_dataset: User,
         service: TransactionService,
     ):
-        """Test that page_transactions filters by counterparty name."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create two counterparties
-        counterparty1 = Counterparty(name="Supermarket ABC", account_number="111111111")
-        counterparty2 = Counterparty(name="Gas Station XYZ", account_number="222222222")
-        async_session.add(counterparty1)
-        async_session.add(counterparty2)
-        await async_session.flush()
-
-        # Create transactions
-        txn1 = await create_transaction(async_session, bank_account, counterparty1, transaction_number="TXN_ABC")
-        await create_transaction(async_session, bank_account, counterparty2, transaction_number="TXN_XYZ")
-        await async_session.commit()
-
-        # Query by counterparty name (partial match)
-        query = TransactionQuery(counterparty_name="ABC")
-        transactions, total = await service.page_transactions(
-            query=query,
-            page=0,
-            size=10,
-            sort_order="asc",
-            sort_property="transaction_id",
-            user=user,
-            session=async_session,
-        )
+        """Test that count_transactions counts only the transactions matching the query."""
+        query = TransactionQuery(transaction_type=TransactionTypeEnum.EXPENSES)
 
-        assert total == 1
-        assert transactions[0].transaction_id == txn1.transaction_id
+        assert await service.count_transactions(query=query, user=filter_dataset, session=async_session) == 5
 
-    @pytest.mark.asyncio
-    async def test_page_transactions_sorts_ascending(
+    async def test_page_transactions_past_last_page_returns_total_only(
         self,
         async_session: AsyncSession,
-        user: User,
+        pagination_dataset: Tuple[User, List[str]],
         service: TransactionService,
     ):
-        """Test that page_transactions sorts in ascending order."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
+        """Test that a page past the last row returns no transactions but still reports the total."""
+        user, _ = pagination_dataset
 
-        # Create transactions with different amounts
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-100.0,
-            transaction_number="TXN_100",
-        )
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-10.0,
-            transaction_number="TXN_10",
-        )
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            transaction_number="TXN_50",
-        )
-        await async_session.commit()
-
-        # Query sorted by amount ascending
         transactions, total = await service.page_transactions(
             query=None,
-            page=0,
-            size=10,
-            sort_order="asc",
-            sort_property="amount",
-            user=user,
-            session=async_session,
-        )
-
-        assert total == 3
-        assert transactions[0].amount == -100.0
-        assert transactions[1].amount == -50.0
-        assert transactions[2].amount == -10.0
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_sorts_descending(
-        self,
-        async_session: AsyncSession,
-        user: User,
-        service: TransactionService,
-    ):
-        """Test that page_transactions sorts in descending order."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transactions with different amounts
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-100.0,
-            transaction_number="TXN_100",
-        )
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-10.0,
-            transaction_number="TXN_10",
-        )
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            transaction_number="TXN_50",
-        )
-        await async_session.commit()
-
-        # Query sorted by amount descending
-        transactions, total = await service.page_transactions(
-            query=None,
-            page=0,
-            size=10,
-            sort_order="desc",
-            sort_property="amount",
-            user=user,
-            session=async_session,
-        )
-
-        assert total == 3
-        assert transactions[0].amount == -10.0
-        assert transactions[1].amount == -50.0
-        assert transactions[2].amount == -100.0
-
-    @pytest.mark.asyncio
-    async def test_page_transactions_returns_empty_for_user_without_accounts(
-        self,
-        async_session: AsyncSession,
-        user: User,
-        service: TransactionService,
-    ):
-        """Test that page_transactions returns empty for user without bank accounts."""
-        transactions, total = await service.page_transactions(
-            query=None,
-            page=0,
+            page=10,
             size=10,
             sort_order="asc",
             sort_property="transaction_id",
@@ -966,28 +705,31 @@ class TestTransactionService:
         )
 
         assert transactions == []
-        assert total == 0
+        assert total == 99
 
     @pytest.mark.asyncio
     async def test_get_distinct_counterparty_names(
         self,
         async_session: AsyncSession,
         bank_account: BankAccount,
+        counterparty_factory: Callable[..., Counterparty],
         service: TransactionService,
     ):
         """Test that get_distinct_counterparty_names returns unique names."""
         # Create counterparties
-        counterparty1 = Counterparty(name="Counterparty A", account_number="111111111")
-        counterparty2 = Counterparty(name="Counterparty B", account_number="222222222")
-        async_session.add(counterparty1)
-        async_session.add(counterparty2)
-        await async_session.flush()
+        counterparty1 = counterparty_factory()
+        counterparty2 = counterparty_factory()
+        async_session.add_all([counterparty1, counterparty2])
 
         # Create transactions - 2 with counterparty1, 1 with counterparty2
-        await create_transaction(async_session, bank_account, counterparty1, transaction_number="TXN_1")
-        await create_transaction(async_session, bank_account, counterparty1, transaction_number="TXN_2")
-        await create_transaction(async_session, bank_account, counterparty2, transaction_number="TXN_3")
-        await async_session.commit()
+        async_session.add_all(
+            [
+                build_transaction(bank_account, counterparty1, transaction_number="TXN_1"),
+                build_transaction(bank_account, counterparty1, transaction_number="TXN_2"),
+                build_transaction(bank_account, counterparty2, transaction_number="TXN_3"),
+            ]
+        )
+        await async_session.flush()
 
         names = await service.get_distinct_counterparty_names(
             bank_account=bank_account.account_number,
@@ -995,46 +737,18 @@ class TestTransactionService:
         )
 
         assert len(names) == 2
-        assert "Counterparty A" in names
-        assert "Counterparty B" in names
+        assert set(names) == {counterparty1.name, counterparty2.name}
 
     @pytest.mark.asyncio
     async def test_page_transactions_to_manually_review_filters_by_revenue(
         self,
         async_session: AsyncSession,
+        review_dataset: BankAccount,
         service: TransactionService,
     ):
         """Test that page_transactions_to_manually_review filters by revenue type."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create expense and revenue transactions
-        await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=-50.0,
-            is_manually_reviewed=False,
-        )
-        revenue_txn = await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            amount=100.0,
-            is_manually_reviewed=False,
-        )
-        await async_session.commit()
-
-        # Query for revenue only
         transactions, total = await service.page_uncategorized_transactions(
-            bank_account=bank_account.account_number,
+            bank_account=review_dataset.account_number,
             page=0,
             size=10,
             sort_order="asc",
@@ -1044,37 +758,18 @@ class TestTransactionService:
         )
 
         assert total == 1
-        assert transactions[0].transaction_id == revenue_txn.transaction_id
+        assert transactions[0].transaction_number == "UNCAT_REV"
 
     @pytest.mark.asyncio
     async def test_page_uncategorized_transactions_filters_transactions_with_category(
         self,
         async_session: AsyncSession,
+        review_dataset: BankAccount,
         service: TransactionService,
     ):
-        """Test that page_transactions_to_manually_review excludes reviewed transactions."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transactions - one reviewed, one not reviewed
-        await create_transaction(
-            async_session, bank_account, counterparty, amount=-50.0, is_manually_reviewed=True, category_id=1
-        )
-        no_cat_txn = await create_transaction(
-            async_session, bank_account, counterparty, amount=-50.0, is_manually_reviewed=False, category_id=None
-        )
-        await async_session.commit()
-
-        # Query for transactions to review
+        """Test that page_transactions_to_manually_review excludes categorized transactions."""
         transactions, total = await service.page_uncategorized_transactions(
-            bank_account=bank_account.account_number,
+            bank_account=review_dataset.account_number,
             page=0,
             size=10,
             sort_order="asc",
@@ -1083,144 +778,53 @@ class TestTransactionService:
             session=async_session,
         )
 
-        assert total == 1
-        assert transactions[0].transaction_id == no_cat_txn.transaction_id
-
-    @pytest.mark.asyncio
-    async def test_save_transaction_updates_is_recurring(
-        self,
-        async_session: AsyncSession,
-        service: TransactionService,
-    ):
-        """Test that save_transaction updates is_recurring field."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transaction with is_recurring=False
-        transaction = await create_transaction(async_session, bank_account, counterparty)
-        await async_session.commit()
-
-        # Update is_recurring
-        update_data = TransactionUpdate(is_recurring=True)
-        updated = await service.save_transaction(
-            transaction_id=transaction.transaction_id,
-            update_data=update_data,
-            session=async_session,
-        )
-
-        assert updated.is_recurring is True
-
-    @pytest.mark.asyncio
-    async def test_save_transaction_updates_is_advance_shared_account(
-        self,
-        async_session: AsyncSession,
-        service: TransactionService,
-    ):
-        """Test that save_transaction updates is_advance_shared_account field."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transaction with is_advance_shared_account=False
-        transaction = await create_transaction(async_session, bank_account, counterparty)
-        await async_session.commit()
-
-        # Update is_advance_shared_account
-        update_data = TransactionUpdate(is_advance_shared_account=True)
-        updated = await service.save_transaction(
-            transaction_id=transaction.transaction_id,
-            update_data=update_data,
-            session=async_session,
-        )
-
-        assert updated.is_advance_shared_account is True
+        assert total == 3
+        assert "CAT_EXP" not in {t.transaction_number for t in transactions}
+        assert all(t.category_id is None for t in transactions)
 
-    @pytest.mark.asyncio
-    async def test_save_transaction_updates_is_manually_reviewed(
+    @pytest.mark.parametrize("field", ["is_recurring", "is_advance_shared_account", "is_manually_reviewed"])
+    async def test_save_transaction_updates_flag(
         self,
         async_session: AsyncSession,
+        bank_account: BankAccount,
+        counterparty: Counterparty,
         service: TransactionService,
+        field: str,
     ):
-        """Test that save_transaction updates is_manually_reviewed field."""
-        # Create bank account
-        bank_account = BankAccount(account_number="123456789")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
-
-        # Create transaction with is_manually_reviewed=False
+        """Test that save_transaction sets a boolean flag that starts out False."""
         transaction = await create_transaction(async_session, bank_account, counterparty)
-        await async_session.commit()
+        assert getattr(transaction, field) is False
 
-        # Update is_manually_reviewed
-        update_data = TransactionUpdate(is_manually_reviewed=True)
         updated = await service.save_transaction(
             transaction_id=transaction.transaction_id,
-            update_data=update_data,
+            update_data=TransactionUpdate(**{field: True}),
             session=async_session,
         )
 
-        assert updated.is_manually_reviewed is True
+        assert getattr(updated, field) is True
 
     @pytest.mark.asyncio
     async def test_page_transactions_filters_by_category_id(
         self,
         async_session: AsyncSession,
         user: User,
+        account_setup: SimpleNamespace,
         category: Category,
         service: TransactionService,
     ):
         """Test that page_transactions filters by category_id."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
+        bank_account, counterparty = account_setup.bank_account, account_setup.counterparty
 
         # Create transactions - one with category, one without
-        txn_with_category = await create_transaction(
-            async_session,
-            bank_account,
-            counterparty,
-            category_id=category.id,
-            transaction_number="TXN_CAT",
-        )
-        await create_transaction(
+        txn_with_category, _ = await create_transactions(
             async_session,
             bank_account,
             counterparty,
-            category_id=None,
-            transaction_number="TXN_NO_CAT",
+            [
+                {"category_id": category.id, "transaction_number": "TXN_CAT"},
+                {"category_id": None, "transaction_number": "TXN_NO_CAT"},
+            ],
         )
-        await async_session.commit()
 
         # Query by category_id
         query = TransactionQuery(category_id=category.id)
@@ -1242,65 +846,32 @@ class TestTransactionService:
         self,
         async_session: AsyncSession,
         user: User,
+        account_setup: SimpleNamespace,
         service: TransactionService,
     ):
         """Test that page_transactions filters by transaction or communication text."""
-        # Create bank account associated with user
-        bank_account = BankAccount(account_number="test_account")
-        async_session.add(bank_account)
-        await async_session.flush()
-
-        link = UserBankAccountLink(
-            user_id=user.id,
-            bank_account_number=bank_account.account_number,
-        )
-        async_session.add(link)
-        await async_session.flush()
-
-        # Create counterparty
-        counterparty = Counterparty(name="Test Counterparty", account_number="987654321")
-        async_session.add(counterparty)
-        await async_session.flush()
+        bank_account, counterparty = account_setup.bank_account, account_setup.counterparty
 
         # Create transactions with different communications
-        import uuid
-
-        txn_id_1 = str(uuid.uuid4())
-        txn_id_2 = str(uuid.uuid4())
-
-        txn1 = Transaction(
-            transaction_id=Transaction.create_transaction_id(txn_id_1, bank_account.account_number),
-            bank_account_id=bank_account.account_number,
-            booking_date=date.today(),
-            statement_number="001",
-            counterparty_id=counterparty.name,
-            transaction_number=txn_id_1,
-            transaction="Groceries purchase",
-            currency_date=date.today(),
-            amount=-50.0,
-            currency="EUR",
-            country_code="BE",
-            communications="Payment for groceries",
-            upload_timestamp=datetime.now(timezone.utc),
-        )
-        txn2 = Transaction(
-            transaction_id=Transaction.create_transaction_id(txn_id_2, bank_account.account_number),
-            bank_account_id=bank_account.account_number,
-            booking_date=date.today(),
-            statement_number="001",
-            counterparty_id=counterparty.name,
-            transaction_number=txn_id_2,
-            transaction="Fuel purchase",
-            currency_date=date.today(),
-            amount=-30.0,
-            currency="EUR",
-            country_code="BE",
-            communications="Payment for fuel",
-            upload_timestamp=datetime.now(timezone.utc),
+        txn1, _ = await create_transactions(
+            async_session,
+            bank_account,
+            counterparty,
+            [
+                {
+                    "amount": -50.0,
+                    "transaction": "Groceries purchase",
+                    "communications": "Payment for groceries",
+                    "transaction_number": "TXN_GROCERIES",
+                },
+                {
+                    "amount": -30.0,
+                    "transaction": "Fuel purchase",
+                    "communications": "Payment for fuel",
+                    "transaction_number": "TXN_FUEL",
+                },
+            ],
         )
-        async_session.add(txn1)
-        async_session.add(txn2)
-        await async_session.commit()
 
         # Query by transaction text
         query = TransactionQuery(transaction_or_communication="groceries")
@@ -1,8 +1,10 @@
 """Test utility functions for database model testing."""
 
+import json
 import random
 from datetime import datetime
 from typing import Any, Optional, Tuple, Type
+from urllib.parse import urlencode
 
 from faker import Faker
 from polyfactory.factories.pydantic_factory import ModelFactory
@@ -437,3 +439,69 @@ async def assert_persisted(
         )
 
     return instance
+
+
+# =============================================================================
+# ASGI helpers
+# =============================================================================
+
+
+async def asgi_status(
+    app: Any,
+    method: str,
+    path: str,
+    *,
+    json_body: Any = None,
+    params: Optional[dict[str, str]] = None,
+    headers: Optional[dict[str, str]] = None,
+) -> int:
+    """Call the ASGI app directly and return only the response status code.
+
+    Skips the HTTP client stack for tests that only check the status, such as 401 checks.
+
+    Args:
+        app: The ASGI application.
+        method: The HTTP method.
+        path: The request path.
+        json_body: Optional body, sent JSON-encoded.
+        params: Optional query parameters.
+        headers: Optional request headers.
+
+    Returns:
+        The status code of the response.
+    """
+    body = b"" if json_body is None else json.dumps(json_body).encode()
+    raw_headers = [(b"host", b"test")]
+    if json_body is not None:
+        raw_headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    raw_headers += [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": urlencode(params or {}).encode(),
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 123),
+        "server": ("test", 80),
+    }
+    request_sent = False
+    status = {}
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+
+    await app(scope, receive, send)
+    return status["code"]